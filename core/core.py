@@ -877,7 +877,12 @@ class PortScanner(QThread):
             i = 0
             while i < 256:  # Reasonable limit to prevent infinite loops
                 try:
-                    device_name, port_name, _ = winreg.EnumValue(key, i)
+                    device_name, port_name, value_type = winreg.EnumValue(key, i)
+                    
+                    # Port names are REG_SZ; skip anything else before classifying
+                    if value_type != winreg.REG_SZ:
+                        i += 1
+                        continue
                     
                     # Classify the port type
                     port_info = self.classify_port(device_name, port_name)
@@ -6,12 +6,15 @@ A PyQt6 serial terminal application with split pane support and advanced formatt
 
 import sys
 import os
+import threading
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication, QSplashScreen
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QFont, QColor
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QRunnable, QThreadPool
 from PyQt6.QtSvg import QSvgRenderer
+import serial.tools.list_ports
 
+from core.core import WINREG_AVAILABLE
 from ui.dialogs.terminal_dialog import SerialMonitorWindow
 from ui.resources import resource_manager
 from constants import AppInfo
@@ -127,6 +130,25 @@ class TerminalSplashScreen(QSplashScreen):
         painter.end()
 
 
+class PortEnumerationTask(QRunnable):
+    """Enumerate serial ports in the background while the UI is loading"""
+
+    def __init__(self):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.ports = None
+        self.done = threading.Event()  # Set once ports holds the result
+
+    def run(self):
+        try:
+            self.ports = serial.tools.list_ports.comports()
+        except Exception as e:
+            print(f"Error enumerating serial ports: {e}")
+            self.ports = None
+        finally:
+            self.done.set()
+
+
 def create_splash_screen():
     """Create and return splash screen"""
     splash_pixmap = QPixmap(320, 180)
@@ -168,6 +190,13 @@ def main():
 
     app.processEvents()
 
+    # Enumerate serial ports in parallel with font and icon loading. Where the
+    # registry is available its scan supersedes serial.tools, so skip the pre-scan.
+    port_task = None
+    if not WINREG_AVAILABLE:
+        port_task = PortEnumerationTask()
+        QThreadPool.globalInstance().start(port_task)
+
     # Update splash
     splash.update_status("Initializing...")
     splash.set_progress(20)
@@ -195,8 +224,11 @@ def main():
     splash.set_progress(80)
     app.processEvents()
 
-    # Create terminal window
-    terminal_window = SerialMonitorWindow()
+    # Create terminal window with the pre-enumerated ports (if the scan finished in time)
+    available_ports = None
+    if port_task is not None and port_task.done.wait(2.0):
+        available_ports = port_task.ports
+    terminal_window = SerialMonitorWindow(available_ports=available_ports)
     terminal_window.setWindowIcon(terminal_icon)
     terminal_window.setWindowTitle(AppInfo.NAME)
 
@@ -4,8 +4,8 @@ SVG icon definitions for the application.
 Circular colored design matching application theme.
 """
 
-from PyQt6.QtGui import QPalette, QIcon, QPainter, QPixmap
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPalette, QIcon, QPainter, QPixmap, QImage
+from PyQt6.QtCore import Qt, QRect, QRectF
 from PyQt6.QtSvg import QSvgRenderer
 
 
@@ -112,3 +112,32 @@ class Icons:
         painter.end()
 
         return QIcon(pixmap)
+
+    @staticmethod
+    def build_all(names, size: int = 32) -> dict:
+        """Rasterise the named fixed-colour icons into one strip with a single painter"""
+        sources = {
+            'play': lambda: Icons.play(None),
+            'create': Icons.create,
+            'quick_setup': Icons.quick_setup,
+            'refresh': Icons.refresh,
+            'remove': Icons.remove,
+            'close': Icons.close,
+            'settings': lambda: Icons.settings(None),
+        }
+        svgs = {name: sources[name]() for name in names}
+
+        # Render every icon side by side into one image
+        image = QImage(size * len(svgs), size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        for i, svg_str in enumerate(svgs.values()):
+            renderer = QSvgRenderer(svg_str.encode('utf-8'))
+            renderer.render(painter, QRectF(i * size, 0, size, size))
+        painter.end()
+
+        # Slice the strip back into individual icons
+        return {
+            name: QIcon(QPixmap.fromImage(image.copy(QRect(i * size, 0, size, size))))
+            for i, name in enumerate(svgs)
+        }
@@ -1,5 +1,5 @@
 """UI Components for Serial Terminal"""
 
-from .ribbon_toolbar import RibbonToolbar, RibbonButton
+from .ribbon_toolbar import RibbonToolbar, make_ribbon_button, set_button_icon
 
-__all__ = ['RibbonToolbar', 'RibbonButton']
+__all__ = ['RibbonToolbar', 'make_ribbon_button', 'set_button_icon']
@@ -1,36 +1,46 @@
 """Ribbon-style toolbar for Serial Terminal commands."""
 
-from PyQt6.QtWidgets import QToolBar, QWidget, QHBoxLayout, QPushButton
-from PyQt6.QtCore import pyqtSignal, QSize
-from PyQt6.QtGui import QIcon, QFont
+from contextlib import contextmanager
+from PyQt6.QtWidgets import QToolBar, QWidget, QPushButton, QSizePolicy
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer
+from PyQt6.QtGui import QIcon, QFont, QAction
 
-from ..resources import resource_manager
+# Icon size for standalone ribbon buttons (the toolbar sets its own via stylesheet)
+_ICON_SIZE = QSize(16, 16)
 
 
-class RibbonButton(QPushButton):
-    """Large ribbon-style button with icon and text."""
+@contextmanager
+def _signals_blocked(obj):
+    """Temporarily block Qt signals on obj, restoring the previous state."""
+    prev = obj.blockSignals(True)
+    try:
+        yield
+    finally:
+        obj.blockSignals(prev)
 
-    def __init__(self, text: str, icon_name: str = None, parent=None):
-        super().__init__(parent)
-        self.setText(text)
 
-        # Set icon if provided using resource manager
-        if icon_name:
-            icon = resource_manager.get_toolbar_icon(icon_name)
-            if not icon.isNull():
-                self.setIcon(icon)
-                self.setIconSize(QSize(16, 16))
+def make_ribbon_button(text: str, icon_name: str = None, parent=None) -> QPushButton:
+    """Create a ribbon-style push button with icon and text."""
+    button = QPushButton(text, parent)
+
+    # Set icon if provided using resource manager
+    if icon_name:
+        set_button_icon(button, icon_name)
+
+    # Set medium font weight for better readability
+    font = button.font()
+    font.setWeight(QFont.Weight.Medium)
+    button.setFont(font)
+    return button
 
-        # Set medium font weight for better readability
-        font = self.font()
-        font.setWeight(QFont.Weight.Medium)
-        self.setFont(font)
 
-    def update_icon(self, icon_name: str):
-        """Update button icon dynamically."""
-        icon = resource_manager.get_toolbar_icon(icon_name)
-        if not icon.isNull():
-            self.setIcon(icon)
+def set_button_icon(button: QPushButton, icon_name: str):
+    """Update a ribbon button icon dynamically."""
+    from ..resources import resource_manager
+    icon = resource_manager.get_toolbar_icon(icon_name)
+    if icon is not None:
+        button.setIcon(icon)
+        button.setIconSize(_ICON_SIZE)
 
 
 class RibbonToolbar(QToolBar):
@@ -43,71 +53,106 @@ class RibbonToolbar(QToolBar):
     clear_terminal = pyqtSignal()
     show_settings = pyqtSignal()
 
+    # Action layout: (attribute, text, icon, tooltip, signal)
+    _ACTION_SPEC = (
+        ("new_action", "New", "new", "New connection (Ctrl+N)", "new_connection"),
+        ("refresh_action", "Refresh", "refresh", "Refresh available ports", "refresh_ports"),
+        ("connect_action", "Connect", "enable", "Connect to serial port", "toggle_connection"),
+        ("clear_action", "Clear", "remove", "Clear terminal output", "clear_terminal"),
+        ("settings_action", "Settings", "configure", "Application settings", "show_settings"),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_ui()
-        self.setup_actions()
+
+        # Throttle connection state updates to at most one per 50ms
+        self._is_connected = None  # Last state applied to the connect button
+        self._pending_connected = None
+        self._state_throttle_timer = QTimer(self)
+        self._state_throttle_timer.setSingleShot(True)
+        self._state_throttle_timer.setInterval(50)
+        self._state_throttle_timer.timeout.connect(self._flush_connection_state)
 
     def setup_ui(self):
-        """Set up the ribbon toolbar UI."""
-        self.setMovable(False)
-        self.setFloatable(False)
-        self.setMinimumHeight(48)
-        self.setMaximumHeight(48)
-
-        # Main widget to hold ribbon buttons (flat layout, no groups)
-        main_widget = QWidget()
-        main_layout = QHBoxLayout(main_widget)
-        main_layout.setSpacing(4)  # 4px spacing between buttons like SerialRouter
-        main_layout.setContentsMargins(5, 5, 5, 5)
-
-        # Create 5 buttons in flat layout
-        self.new_button = RibbonButton("New", "new")
-        self.new_button.setToolTip("New connection (Ctrl+N)")
-
-        self.refresh_button = RibbonButton("Refresh", "refresh")
-        self.refresh_button.setToolTip("Refresh available ports")
-
-        self.connect_button = RibbonButton("Connect", "enable")
-        self.connect_button.setToolTip("Connect to serial port")
-
-        self.clear_button = RibbonButton("Clear", "remove")
-        self.clear_button.setToolTip("Clear terminal output")
-
-        self.settings_button = RibbonButton("Settings", "configure")
-        self.settings_button.setToolTip("Application settings")
-
-        # Add buttons to layout
-        main_layout.addWidget(self.new_button)
-        main_layout.addWidget(self.refresh_button)
-        main_layout.addWidget(self.connect_button)
-        main_layout.addWidget(self.clear_button)
-        main_layout.addWidget(self.settings_button)
-        main_layout.addStretch()
-
-        # Add main widget to toolbar
-        self.addWidget(main_widget)
-
-    def setup_actions(self):
-        """Set up button actions."""
-        self.new_button.clicked.connect(self.new_connection.emit)
-        self.refresh_button.clicked.connect(self.refresh_ports.emit)
-        self.connect_button.clicked.connect(self.toggle_connection.emit)
-        self.clear_button.clicked.connect(self.clear_terminal.emit)
-        self.settings_button.clicked.connect(self.show_settings.emit)
+        """Set up the ribbon toolbar actions."""
+        with _signals_blocked(self):
+            self.setMovable(False)
+            self.setFloatable(False)
+            self.setMinimumHeight(48)
+            self.setMaximumHeight(48)
+            self.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
+            # Spacing, padding and icon size resolved from one cached style rule
+            self.setStyleSheet(
+                "QToolBar { spacing: 4px; padding: 5px; qproperty-iconSize: 16px 16px; }"
+            )  # 4px between buttons like SerialRouter
+
+            # Set medium font weight for better readability
+            font = self.font()
+            font.setWeight(QFont.Weight.Medium)
+            self.setFont(font)
+
+            # Resource manager is imported on first toolbar construction
+            from ..resources import resource_manager
+
+            # Create actions directly on the toolbar and wire them to their signals
+            for attr, text, icon_name, tooltip, signal in self._ACTION_SPEC:
+                action = QAction(text, self)
+                icon = resource_manager.get_toolbar_icon(icon_name)
+                if icon is not None:
+                    action.setIcon(icon)
+                action.setToolTip(tooltip)
+                action.triggered.connect(getattr(self, signal))
+                self.addAction(action)
+                setattr(self, attr, action)
+
+            # Trailing spacer keeps the actions packed to the left
+            self._spacer = QWidget()
+            self._spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+            self.addWidget(self._spacer)
+
+            # Disconnect shares the connect tool button; state changes swap its default action
+            self.disconnect_action = QAction(
+                resource_manager.get_toolbar_icon("disable") or QIcon(), "Disconnect", self
+            )
+            self.disconnect_action.setToolTip("Disconnect from serial port")
+            self.disconnect_action.triggered.connect(self.toggle_connection)
+            self.connect_button = self.widgetForAction(self.connect_action)
+
+            # Settings menu is positioned relative to its tool button
+            self.settings_button = self.widgetForAction(self.settings_action)
 
     def set_connection_state(self, is_connected: bool):
-        """Update connect/disconnect button based on connection state."""
-        if is_connected:
-            self.connect_button.setText("Disconnect")
-            self.connect_button.setToolTip("Disconnect from serial port")
-            self.connect_button.update_icon("disable")
-        else:
-            self.connect_button.setText("Connect")
-            self.connect_button.setToolTip("Connect to serial port")
-            self.connect_button.update_icon("enable")
+        """Update connect/disconnect button, coalescing rapid state flips."""
+        if self._is_connected == is_connected and not self._state_throttle_timer.isActive():
+            return
+        if self._state_throttle_timer.isActive():
+            # Apply the latest state when the throttle window closes
+            self._pending_connected = is_connected
+            return
+        self._apply_connection_state(is_connected)
+        self._state_throttle_timer.start()
+
+    def _flush_connection_state(self):
+        """Apply the last state requested during the throttle window."""
+        if self._pending_connected is not None:
+            is_connected = self._pending_connected
+            self._pending_connected = None
+            self._apply_connection_state(is_connected)
+            self._state_throttle_timer.start()
+
+    def _apply_connection_state(self, is_connected: bool):
+        """Show the pre-built connect or disconnect action on the connect button."""
+        if self._is_connected == is_connected:
+            return
+        self._is_connected = is_connected
+
+        self.connect_button.setDefaultAction(
+            self.disconnect_action if is_connected else self.connect_action
+        )
 
     def set_pane_actions_enabled(self, enabled: bool):
         """Enable/disable pane-specific actions based on context."""
-        self.connect_button.setEnabled(enabled)
-        self.clear_button.setEnabled(enabled)
+        self.connect_action.setEnabled(enabled)
+        self.disconnect_action.setEnabled(enabled)
+        self.clear_action.setEnabled(enabled)
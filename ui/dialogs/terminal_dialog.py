@@ -5,17 +5,28 @@ A complete terminal implementation with split pane support and terminal formatti
 Refactored to match main GUI menu implementation.
 """
 
+import os
+import re
 import sys
+import time
+import codecs
+import binascii
+import functools
 import serial
 import serial.tools.list_ports
 from typing import Optional, Dict, List
+from dataclasses import dataclass
 from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 from PyQt6.QtSvg import QSvgRenderer
 from datetime import datetime
-import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED, TimeoutError as FutureTimeoutError
+import weakref
+from collections import deque
 import atexit
+import contextlib
 
 
 from ui.windows.terminal_formatter import TerminalStreamFormatter
@@ -28,19 +39,25 @@ from ui.common import Icons
 
 
 class SerialPortRegistry:
-    _ports = set()
+    # Weak refs so closed panes' workers can be collected; mutated from worker threads
+    _ports = weakref.WeakSet()
+    _lock = threading.Lock()
     
     @classmethod
     def register(cls, worker):
-        cls._ports.add(worker)
+        with cls._lock:
+            cls._ports.add(worker)
     
     @classmethod
     def unregister(cls, worker):
-        cls._ports.discard(worker)
+        with cls._lock:
+            cls._ports.discard(worker)
     
     @classmethod
     def cleanup_all(cls):
-        for worker in list(cls._ports):
+        with cls._lock:
+            workers = list(cls._ports)
+        for worker in workers:
             try:
                 if hasattr(worker, 'serial_port') and worker.serial_port:
                     worker.serial_port.close()
@@ -51,20 +68,303 @@ class SerialPortRegistry:
 atexit.register(SerialPortRegistry.cleanup_all)
 
 
+# ===== PORT SCAN CACHE =====
+@dataclass(slots=True)
+class SimplePort:
+    """Minimal port description for serial.tools results (registry scan unavailable)"""
+    port_name: str
+    device_name: str = "Unknown"
+    is_moxa: bool = False
+    port_type: str = "Hardware"
+
+
+# Scan results shared by all panes for a short time
+_PORT_CACHE = {'ts': 0.0, 'ports': None}
+_PORT_CACHE_TTL = 2.5  # seconds
+_port_cache_lock = threading.Lock()
+
+
+_port_scan_lock = threading.Lock()  # One scan at a time; waiting callers reuse its result
+
+# "COM40-COM99" or "COM40-99": shared name prefix with a numeric range
+_PORT_RANGE_RE = re.compile(r'(.*?)(\d+)\s*-\s*(?:\1)?(\d+)')
+
+
+def _parse_port_ranges(spec: str) -> frozenset:
+    """Upper-cased port names from a list like "COM5,COM40-COM99" """
+    names = set()
+    for item in spec.split(','):
+        item = item.strip().upper()
+        if not item:
+            continue
+        match = _PORT_RANGE_RE.fullmatch(item)
+        if match:
+            prefix, first, last = match.group(1), int(match.group(2)), int(match.group(3))
+            names.update(f"{prefix}{number}" for number in range(first, last + 1))
+        else:
+            names.add(item)
+    return frozenset(names)
+
+
+# Ports never listed, e.g. Bluetooth SPP ports that stall enumeration
+_EXCLUDED_PORTS = _parse_port_ranges(os.environ.get('SERIALTERMINAL_EXCLUDE_PORTS', ''))
+
+
+# Registry walk and serial.tools enumeration run side by side (scans are serialized by _port_scan_lock)
+_port_scan_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="port-scan")
+_PORT_SCAN_TIMEOUT = 2.0  # seconds to wait for the registry once serial.tools has answered
+
+
+def _scan_registry_ports() -> list:
+    """Walk the registry for COM ports (empty list on failure)"""
+    try:
+        return PortScanner().scan_registry_ports()
+    except Exception as e:
+        print(f"Error scanning registry ports: {e}")
+        return []
+
+
+def _scan_basic_ports(fallback_ports=None) -> list:
+    """SimplePort list from serial.tools.list_ports"""
+    try:
+        if fallback_ports is None:
+            fallback_ports = serial.tools.list_ports.comports()
+        return [SimplePort(port.device,
+                           port.description if port.description and port.description != "n/a" else "Unknown")
+                for port in fallback_ports]
+    except Exception as e:
+        print(f"Error with basic port scan: {e}")
+        return []
+
+
+def _scan_com_ports(fallback_ports=None) -> list:
+    """Scan registry ports, falling back to serial.tools.list_ports, and cache the result"""
+    registry = _port_scan_executor.submit(_scan_registry_ports)
+    if fallback_ports is not None:
+        # Startup already enumerated serial.tools; it stands in for the basic scan
+        basic = Future()
+        basic.set_result(_scan_basic_ports(fallback_ports))
+    else:
+        basic = _port_scan_executor.submit(_scan_basic_ports)
+    done, _ = wait((registry, basic), return_when=FIRST_COMPLETED)
+    if registry in done and registry.result():
+        basic.cancel()  # Registry answered first; serial.tools result is not needed
+        ports = registry.result()
+    else:
+        # Registry is preferred, but don't let a slow walk hold up the fallback
+        try:
+            ports = registry.result(timeout=_PORT_SCAN_TIMEOUT)
+        except FutureTimeoutError:
+            print("Registry port scan timed out, using serial.tools results")
+            ports = []
+        if not ports:
+            ports = basic.result()
+
+    # Drop excluded and repeated port names (first entry wins) so no consumer shows a port twice
+    seen = set(_EXCLUDED_PORTS)
+    ports = [port for port in ports
+             if not (port.port_name.upper() in seen or seen.add(port.port_name.upper()))]
+
+    with _port_cache_lock:
+        _PORT_CACHE['ts'] = time.monotonic()
+        _PORT_CACHE['ports'] = ports
+    return ports
+
+
+def _get_cached_com_ports() -> Optional[list]:
+    """Return cached scan results if still fresh, otherwise None"""
+    with _port_cache_lock:
+        if _PORT_CACHE['ports'] is not None and time.monotonic() - _PORT_CACHE['ts'] < _PORT_CACHE_TTL:
+            return _PORT_CACHE['ports']
+    return None
+
+
+def _get_com_ports(force: bool = False, fallback_ports=None) -> list:
+    """Return cached ports while fresh, otherwise scan (force=True always rescans)"""
+    if not force:
+        ports = _get_cached_com_ports()
+        if ports is not None:
+            return ports
+
+    requested = time.monotonic()
+    with _port_scan_lock:
+        # A scan that completed while we waited for the lock is fresh enough
+        with _port_cache_lock:
+            if _PORT_CACHE['ports'] is not None and _PORT_CACHE['ts'] >= requested:
+                return _PORT_CACHE['ports']
+        return _scan_com_ports(fallback_ports)
+
+
+class PortScanSignals(QObject):
+    """Signals for PortScanTask (QRunnable cannot emit signals itself)"""
+    finished = pyqtSignal(list)
+
+
+class PortScanTask(QRunnable):
+    """Run a COM port scan on the global thread pool"""
+
+    def __init__(self, signals: PortScanSignals, force: bool = False, fallback_ports=None):
+        super().__init__()
+        self.signals = signals
+        self.force = force
+        self.fallback_ports = fallback_ports
+
+    def run(self):
+        ports = _get_com_ports(self.force, self.fallback_ports)
+        try:
+            self.signals.finished.emit(ports)
+        except RuntimeError:
+            pass  # Receiver was deleted while scanning
+
+
+# Display-text fragments, built once and shared by every port combo/menu
+_SEP = "  •  "
+_MOXA = f"{_SEP}Moxa"
+_HW = f"{_SEP}Hardware Port"
+
+# Type label per port kind; virtual ports fill in their flavour from port_type
+_PORT_KIND_TEMPLATES = {
+    'moxa': _MOXA,
+    'virtual': f"{_SEP}{{}} Port",
+    'hw': _HW,
+}
+
+
+def _port_display_text(port) -> str:
+    """Create display text for a scanned port with type indicators"""
+    name = port.port_name
+    ptype = getattr(port, 'port_type', '')
+    if getattr(port, 'is_moxa', False):
+        kind = 'moxa'
+    elif ptype.startswith("Virtual"):
+        return ''.join((name, _PORT_KIND_TEMPLATES['virtual'].format(ptype.partition(' ')[2] or "Virtual")))
+    else:
+        kind = 'hw'
+    
+    dev = getattr(port, 'device_name', None)
+    if dev and dev != "Unknown":
+        return ''.join((name, _PORT_KIND_TEMPLATES[kind], _SEP, dev))
+    return ''.join((name, _PORT_KIND_TEMPLATES[kind]))
+
+
+def _fill_port_combo(combo: QComboBox, ports: list, display_text) -> None:
+    """Replace a combo's items with ports in one batch instead of one addItem per port"""
+    with QSignalBlocker(combo):
+        combo.clear()
+        combo.addItems([display_text(port) for port in ports])
+        for index, port in enumerate(ports):
+            combo.setItemData(index, sys.intern(port.port_name))
+
+
+def _set_enabled_if_changed(widget: QWidget, enabled: bool) -> None:
+    """setEnabled only on a real change (each call re-polishes and notifies children)"""
+    # WA_ForceDisabled is the widget's own flag; isEnabled() also reflects disabled parents
+    if widget.testAttribute(Qt.WidgetAttribute.WA_ForceDisabled) == enabled:
+        widget.setEnabled(enabled)
+
+
+def _set_focus_if_needed(widget: QWidget) -> None:
+    """setFocus only when the widget doesn't already have it"""
+    if not widget.hasFocus():
+        widget.setFocus()
+
+
+# CRLF or lone CR, normalized to LF before decoding
+_CRLF_RE = re.compile(rb'\r\n|\r')
+
+# Byte table for the hex view's ASCII column: printable bytes kept, the rest shown as '.'
+_PRINTABLE_ASCII = bytes(b if 32 <= b < 127 else 46 for b in range(256))
+
+
+# str.translate table deleting printable ASCII (plus CR, LF, tab), for garbled-data checks
+_ASCII_PRINTABLE_DELETE = dict.fromkeys(
+    i for i in range(128) if chr(i).isprintable() or chr(i) in '\r\n\t'
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_byte_count(bytes_count: int) -> str:
+    """Format byte count for the status bar (polled often while counts rarely change)"""
+    if bytes_count < 1024:
+        return f"{bytes_count}B"
+    elif bytes_count < 1024 * 1024:
+        return f"{bytes_count / 1024:.1f}KB"
+    else:
+        return f"{bytes_count / (1024 * 1024):.1f}MB"
+
+
+_svg_renderer: Optional[QSvgRenderer] = None  # GUI thread only; reloaded for each new icon
+
+
+@functools.lru_cache(maxsize=16)
+def _render_svg_icon(svg: bytes, size: int = 16) -> QIcon:
+    """Rasterize SVG markup into a QIcon once per distinct (markup, size)"""
+    global _svg_renderer
+    if _svg_renderer is None:
+        _svg_renderer = QSvgRenderer()
+    _svg_renderer.load(QByteArray(svg))
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    _svg_renderer.render(painter)
+    painter.end()
+    return QIcon(pixmap)
+
+
+def _checkbox_icon(checked: bool, palette: QPalette) -> QIcon:
+    """Checkbox icon in the palette's colors like VirtualPortManager (cached by markup)"""
+    border_color = palette.color(QPalette.ColorRole.Mid).name()
+    bg_color = palette.color(QPalette.ColorRole.Base).name()
+    check_color = palette.color(QPalette.ColorRole.Highlight).name()
+
+    if checked:
+        svg = f'''<svg width="16" height="16" xmlns="http://www.w3.org/2000/svg">
+            <rect x="0.5" y="0.5" width="15" height="15" fill="{border_color}" stroke="{border_color}" stroke-width="1"/>
+            <rect x="2" y="2" width="12" height="12" fill="{bg_color}"/>
+            <path d="M4 8l2 2 6-6" stroke="{check_color}" stroke-width="1.5" fill="none" stroke-linecap="round"/>
+        </svg>'''
+    else:
+        svg = f'''<svg width="16" height="16" xmlns="http://www.w3.org/2000/svg">
+            <rect x="0.5" y="0.5" width="15" height="15" fill="{border_color}" stroke="{border_color}" stroke-width="1"/>
+        </svg>'''
+    return _render_svg_icon(svg.encode())
+
+
+# White X used for every tab's close button
+_CLOSE_ICON_SVG = b"""<svg width="16" height="16" viewBox="0 0 16 16" xmlns="http://www.w3.org/2000/svg">
+    <line x1="4" y1="4" x2="12" y2="12" stroke="#ffffff" stroke-width="2" stroke-linecap="round"/>
+    <line x1="12" y1="4" x2="4" y2="12" stroke="#ffffff" stroke-width="2" stroke-linecap="round"/>
+</svg>"""
+
+
 # ===== SERIAL WORKER =====
 class SerialWorker(QThread):
     """Background thread for serial communication"""
     
-    dataReceived = pyqtSignal(bytes)
+    dataReceived = pyqtSignal(bytes, int)  # (complete LF-normalized lines or raw bytes, bytes read)
     errorOccurred = pyqtSignal(str)
     connectionStateChanged = pyqtSignal(bool)  # True = connected, False = disconnected
+
+    # Receive batching: emit at most every 8ms, or sooner once 4KB is buffered
+    EMIT_INTERVAL_MS = 8
+    EMIT_MAX_BYTES = 4096
+    # Largest single drain of the driver's receive buffer
+    READ_CHUNK_BYTES = 65536
+    # Lines longer than this are emitted without waiting for a newline
+    MAX_LINE_BYTES = 4096
     
     def __init__(self, config: SerialConfig):
         super().__init__()
         self.config = config
         self.serial_port: Optional[serial.Serial] = None
         self.running = False
-        self.write_queue = queue.Queue()
+        self._pending = bytearray()  # Received bytes not yet emitted
+        self._partial = bytearray()  # Incomplete trailing line held back in line mode
+        self.line_mode = True  # Set by the pane; False delivers raw bytes (hex view)
+        self._tx_ring = deque()  # Single producer (GUI) / single consumer (writer thread)
+        self._tx_event = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
         self._stop_closed_port = False  # Track if stop() closed the port
         
     def run(self):
@@ -80,49 +380,84 @@ class SerialWorker(QThread):
             adaptive_write_timeout = max(0.5, min(timeout_seconds, 10.0))
 
             # Open serial port with adaptive timeouts to prevent blocking
+            # Reads block until data arrives; stop() cancels/closes to interrupt them
             self.serial_port = serial.Serial(
                 port=self.config.port,
                 baudrate=self.config.baudrate,
                 bytesize=self.config.databits,
                 parity=self.config.parity,
                 stopbits=self.config.stopbits,
-                timeout=0.1,
+                timeout=1.0,
                 write_timeout=adaptive_write_timeout  # Adaptive based on baud rate
             )
 
+            self._enable_low_latency()
+
             # Register with cleanup registry
             SerialPortRegistry.register(self)
 
             self.running = True
             self.connectionStateChanged.emit(True)
 
-            while self.running:
-                # Read data if available
-                if self.serial_port.in_waiting > 0:
-                    data = self.serial_port.read(self.serial_port.in_waiting)
-                    self.dataReceived.emit(data)
+            # Writes are drained on their own thread so the read below can block
+            self._writer_thread = threading.Thread(
+                target=self._write_loop,
+                name=f"SerialWriter-{self.config.port}",
+                daemon=True
+            )
+            self._writer_thread.start()
 
-                # Write data from queue with cancellation checking
+            # Received bytes are batched so bursts cross to the GUI thread in one signal.
+            # The read timeout stays fixed - reassigning it reconfigures the port.
+            batch_timer = QElapsedTimer()
+            batch_timer.start()
+
+            while self.running:
+                idle = True  # Driver has nothing more buffered after this read
                 try:
-                    # Use timeout-based get to allow periodic cancellation checks
-                    while self.running:  # Check running flag
-                        try:
-                            data = self.write_queue.get(timeout=0.05)  # 50ms timeout
-                            if not self.running:  # Double-check before writing
-                                break
-                            self.serial_port.write(data)
-                        except queue.Empty:
-                            break  # No more data to write
-                        except serial.SerialTimeoutException:
-                            # Write timeout - port might be slow, continue
-                            pass
-                except Exception as e:
-                    # Log unexpected write errors but continue running
-                    print(f"Write error: {e}")
+                    # Block for the first byte, then drain whatever else is waiting
+                    data = self.serial_port.read(1)
+                    if data:
+                        data += self._read_available()
+                        idle = not self.serial_port.in_waiting
+                except (serial.SerialException, TypeError, OSError) as e:
+                    if not self.running:
+                        break  # Port closed by stop() to interrupt the blocking read
+                    if isinstance(e, serial.SerialException):
+                        raise
+                    # Anything else escaping QThread.run would abort the app
+                    raise serial.SerialException(str(e)) from e
+
+                if data:
+                    if not self._pending:
+                        batch_timer.restart()
+                    self._pending.extend(data)
+
+                # Emit once the driver is drained, the window expires or the batch is large
+                if self._pending and (idle
+                                      or len(self._pending) >= self.EMIT_MAX_BYTES
+                                      or batch_timer.elapsed() >= self.EMIT_INTERVAL_MS):
+                    self._flush_pending()
+                elif not data and self._partial:
+                    # No newline for a full idle timeout - show the incomplete line
+                    self._flush_pending(include_partial=True)
 
-                # Check for unsent data after loop exits due to shutdown
-                if not self.running and not self.write_queue.empty():
-                    lost_bytes = self.write_queue.qsize()
+        except serial.SerialException as e:
+            self.errorOccurred.emit(str(e))
+        finally:
+            self.running = False
+
+            # Deliver any bytes still batched when the port stopped
+            self._flush_pending(include_partial=True)
+
+            # Let the writer thread finish before the port goes away
+            if self._writer_thread is not None:
+                self._writer_thread.join(1.0)
+                self._writer_thread = None
+
+                # Check for unsent data after shutdown
+                if self._tx_ring:
+                    lost_bytes = len(self._tx_ring)
                     warning_msg = f"Warning: {lost_bytes} data items not sent - disconnected before transmission complete"
                     # Try to emit warning (may be blocked if cleanup() already called blockSignals)
                     try:
@@ -131,10 +466,7 @@ class SerialWorker(QThread):
                         pass  # Signal blocked or object deleted
                     # Always log to console so it's visible
                     print(warning_msg)
-                    
-        except serial.SerialException as e:
-            self.errorOccurred.emit(str(e))
-        finally:
+
             # Unregister from cleanup registry
             SerialPortRegistry.unregister(self)
 
@@ -142,18 +474,79 @@ class SerialWorker(QThread):
             if self.serial_port and self.serial_port.is_open and not self._stop_closed_port:
                 self.serial_port.close()
             self.connectionStateChanged.emit(False)  
+
+    def _read_available(self) -> bytes:
+        """Read whatever the driver has buffered without blocking"""
+        fd = getattr(self.serial_port, 'fd', None)
+        if fd is not None:
+            # pyserial opens POSIX ports O_NONBLOCK, so a single read() returns what is there
+            try:
+                return os.read(fd, self.READ_CHUNK_BYTES)
+            except BlockingIOError:
+                return b''
+            except OSError as e:
+                # EIO/ENXIO when a USB adapter is unplugged
+                raise serial.SerialException(f"read failed: {e}") from e
+        waiting = self.serial_port.in_waiting
+        return self.serial_port.read(waiting) if waiting else b''
+
+    def _enable_low_latency(self):
+        """Ask the Linux tty driver to skip its receive batching (ASYNC_LOW_LATENCY)"""
+        # Only pyserial's Linux backend exposes this; USB adapters often reject it
+        if not hasattr(self.serial_port, 'set_low_latency_mode'):
+            return
+        try:
+            self.serial_port.set_low_latency_mode(True)
+        except (ValueError, OSError):
+            pass
+
+    def _flush_pending(self, include_partial: bool = False):
+        """Emit batched received bytes as a single dataReceived signal"""
+        buf = self._partial
+        buf.extend(self._pending)
+        self._pending.clear()
+        if not buf:
+            return
+
+        line_mode = self.line_mode
+        end = len(buf) - 1
+        if line_mode and not include_partial:
+            # Complete lines end at the last newline or carriage return
+            end = max(buf.rfind(b'\n'), buf.rfind(b'\r'))
+            if end == -1:
+                if len(buf) < self.MAX_LINE_BYTES:
+                    return  # Hold the incomplete line for the next batch
+                end = len(buf) - 1  # Force-flush overlong lines
+
+        block = bytes(buf[:end + 1])
+        del buf[:end + 1]
+        raw_len = len(block)
+        if line_mode:
+            # Normalize line endings on the raw bytes (CR/LF are ASCII-safe in UTF-8)
+            block = _CRLF_RE.sub(b'\n', block)
+        self.dataReceived.emit(block, raw_len)
+
+    def _write_loop(self):
+        """Writer thread loop - sleeps on the TX event instead of polling"""
+        while self.running:
+            self._tx_event.wait(0.1)  # Wakes periodically to check running
+            self._tx_event.clear()
+            # deque append/popleft are atomic, so no lock is needed between threads
+            while self._tx_ring and self.running:  # Double-check before writing
+                data = self._tx_ring.popleft()
+                try:
+                    self.serial_port.write(data)
+                except serial.SerialTimeoutException:
+                    # Write timeout - port might be slow, continue
+                    pass
+                except Exception as e:
+                    # Log unexpected write errors but keep running (port may be closing)
+                    if self.running:
+                        print(f"Write error: {e}")
                  
     def stop(self):
         """Stop the worker thread safely with graceful shutdown - blocks until complete"""
-        self.running = False
-
-        # Close the serial port to interrupt any blocking reads
-        if self.serial_port and self.serial_port.is_open:
-            try:
-                self.serial_port.close()
-                self._stop_closed_port = True  # Mark that stop() closed the port
-            except Exception as e:
-                print(f"Error closing port during stop: {e}")
+        self.request_stop()
 
         # Wait for thread to finish - blocking call ensures port is fully released
         if self.isRunning():
@@ -163,10 +556,29 @@ class SerialWorker(QThread):
                 # DO NOT terminate() - it can corrupt port driver state
                 # The finally block (line 184-191) should still close the port
                 # OS will clean up thread on process exit   
+
+    def request_stop(self):
+        """Tell the worker to stop and unblock its read without waiting (safe to repeat)"""
+        self.running = False
+        self._tx_event.set()  # Wake the writer thread so it sees the stop
+
+        # Cancel and close the serial port to interrupt any blocking reads
+        if self.serial_port and self.serial_port.is_open:
+            try:
+                self.serial_port.cancel_read()
+            except Exception:
+                pass  # Not supported on every platform - close() still unblocks
+            try:
+                self.serial_port.close()
+                self._stop_closed_port = True  # Mark that stop() closed the port
+            except Exception as e:
+                print(f"Error closing port during stop: {e}")
+
     def write(self, data: bytes):
         """Queue data to be written"""
         if self.running:
-            self.write_queue.put(data)
+            self._tx_ring.append(data)
+            self._tx_event.set()
 
 # ===== TERMINAL PANE =====
 class TerminalPane(QWidget):
@@ -175,49 +587,122 @@ class TerminalPane(QWidget):
     focusChanged = pyqtSignal(bool)
     splitRequested = pyqtSignal(object, str)  # (source_pane, direction)
     closeRequested = pyqtSignal(object)  # source_pane
+    connectionChanged = pyqtSignal(object, bool)  # (source_pane, connected)
+
+    # Lines kept in the terminal before the oldest are discarded
+    MAX_SCROLLBACK_LINES = 10000
+    # Received data kept for a hidden pane (background tab) until it is shown
+    HIDDEN_BACKLOG_BYTES = 256 * 1024
+    # Received chunks are coalesced for this long before being decoded and displayed
+    RX_COALESCE_MS = 16
+
+    # Candidate rates offered when encoding errors suggest a baud mismatch
+    SUGGESTED_BAUD_RATES = (9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600)
+    _BAUD_RATE_INDEX = {rate: i for i, rate in enumerate(SUGGESTED_BAUD_RATES)}
+
+    # Key codes for the local echo path, resolved once instead of per keystroke
+    _K_RETURN = Qt.Key.Key_Return.value
+    _K_ENTER = Qt.Key.Key_Enter.value
+    _K_BACKSPACE = Qt.Key.Key_Backspace.value
+    _K_TAB = Qt.Key.Key_Tab.value
+
+    # Help body shown by F1: (section title, lines)
+    HELP_SECTIONS = [
+        ("CONNECTION", [
+            "- Auto-detects baud rate",
+            "- Supports standard serial protocols",
+            "- Real-time data display"
+        ]),
+        ("DISPLAY OPTIONS", [
+            "- Auto-scroll: Enabled by default",
+            "- Hex Display Mode: Show data as hex",
+            "- Local Echo: Echo typed characters"
+        ]),
+        ("DEFAULTS", [
+            "- Baud Rate: 115200",
+            "- Data Bits: 8",
+            "- Parity: None",
+            "- Stop Bits: 1",
+            "- Font Size: 10pt"
+        ]),
+        ("KEYBOARD SHORTCUTS", [
+            "Navigation:",
+            "- Alt+Arrow Keys: Navigate between panes",
+            "- Ctrl+Tab: Next tab",
+            "- Ctrl+Shift+Tab: Previous tab",
+            "",
+            "Pane Management:",
+            "- Alt+Shift+-: Split pane vertically",
+            "- Alt+Shift++: Split pane horizontally",
+            "- Ctrl+Shift+W: Close current pane",
+            "",
+            "Terminal Actions:",
+            "- Ctrl+C: Copy selected text",
+            "- Ctrl+A: Select all text",
+            "- Ctrl++: Increase font size",
+            "- Ctrl+-: Decrease font size",
+            "",
+            "Window Management:",
+            "- Ctrl+N: New connection",
+            "- Ctrl+W: Close current tab",
+            "- F1: Show this help"
+        ])
+    ]
     
     def __init__(self, config: SerialConfig, parent=None, main_window=None, container=None):
         super().__init__(parent)
         self.config = config
         self.main_window = main_window
         self.container = container
+        self._cb_icons: Optional[Dict[bool, QIcon]] = None  # Built on first use per palette
         self.formatter = TerminalStreamFormatter()
         self.serial_worker: Optional[SerialWorker] = None
         self.is_connected = False
         self.rx_bytes = 0
         self.tx_bytes = 0
         
-        # Line buffering for proper data handling
-        self.line_buffer = ""
-        self.buffer_timer = QTimer()
-        self.buffer_timer.setSingleShot(True)
-        self.buffer_timer.timeout.connect(self._flush_buffer)
+        # Received data awaiting display (line framing is done by the worker)
+        self._line_buf = bytearray()
+        self._hidden_dropped = 0  # Backlog bytes discarded while hidden, reported on show
+        self._rx_timer = QTimer()
+        self._rx_timer.setSingleShot(True)
+        self._rx_timer.timeout.connect(self._process_rx)
         
         # Display settings
         self.encoding = 'utf-8'
+        self._encode = codecs.getencoder(self.encoding)
+        self._decoder = codecs.getincrementaldecoder(self.encoding)(errors='strict')
+        self._local_echo_format = QTextCharFormat()
+        self._local_echo_format.setForeground(QColor(0x90, 0xEE, 0x90))  # Light green for local echo
         self.hex_display_mode = False
         self.local_echo_enabled = True  # Default to enabled
+        self._cached_status: Optional[tuple] = None  # (inputs, text) of the last status bar string
         
         # Baud rate detection and error handling
-        self.encoding_error_count = 0
+        self.encoding_error_count = 0  # Errors within the current window
         self.encoding_error_window = 50  # Track errors over last 50 packets
         self.encoding_error_threshold = 0.3  # 30% error rate threshold
+        self._error_window = deque(maxlen=self.encoding_error_window)  # 1 = error, 0 = clean
         self.last_encoding_warning = 0
         self.encoding_warning_interval = 5.0  # Minimum 5 seconds between warnings
-        self.suggested_baud_rates = [9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600]
-        self.data_packet_count = 0
         self.baud_rate_suggestion_shown = False
         self.consecutive_errors = 0  # Track consecutive errors
         self.max_consecutive_errors = 5  # Stop processing after this many consecutive errors
         
         # Help display management
         self.help_displayed = False
+        self._help_fragment: Optional[QTextDocumentFragment] = None
         self.auto_scroll_state_before_help = True
 
         # Timer tracking for cleanup (prevent dangling references)
         self.pending_baud_timer = None
         self.pending_port_timer = None
 
+        # Background COM port scans for the context menu
+        self._port_scan_pending = False
+        self._port_scan_signals = PortScanSignals(self)
+        self._port_scan_signals.finished.connect(self._on_com_ports_scanned)
+
         self._setup_ui()
         self._setup_context_menu()
         
@@ -229,8 +714,9 @@ class TerminalPane(QWidget):
         layout.setSpacing(0)
         
         # Terminal display
-        self.terminal = QTextEdit()
+        self.terminal = QPlainTextEdit()
         self.terminal.setReadOnly(True)
+        self.terminal.setMaximumBlockCount(self.MAX_SCROLLBACK_LINES)  # Oldest lines are dropped
         self.terminal.setFont(resource_manager.get_monospace_font(size=10))
         self.terminal.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
         
@@ -247,11 +733,62 @@ class TerminalPane(QWidget):
         """Setup right-click context menu"""
         self.terminal.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.terminal.customContextMenuRequested.connect(self._show_context_menu)
+        self._menu: Optional[QMenu] = None  # Built on first right-click, then reused
         
     def _show_context_menu(self, position):
         """Show context menu at position"""
-        menu = self._create_terminal_menu()
-        menu.exec(self.terminal.mapToGlobal(position))
+        self.show_menu_at(self.terminal.mapToGlobal(position))
+
+    def show_menu_at(self, global_pos: QPoint):
+        """Show the pane's cached menu at a global position"""
+        if self._menu is None:
+            self._menu = self._create_terminal_menu()
+            self._menu.aboutToShow.connect(self._refresh_menu_state)
+        self._menu.exec(global_pos)
+
+    def _refresh_menu_state(self):
+        """Update the cached menu's dynamic labels, checkmarks and enabled state"""
+        self._menu_connect_action.setText("Disconnect" if self.is_connected else "Connect")
+        self._menu_auto_scroll_action.setIcon(self.checkbox_icon(self.formatter.is_auto_scroll_enabled()))
+        self._menu_hex_action.setIcon(self.checkbox_icon(self.hex_display_mode))
+        self._menu_local_echo_action.setIcon(self.checkbox_icon(self.local_echo_enabled))
+
+        # Move checkmarks to the current font size and baud rate
+        self._update_menu_checkmarks(self._font_size_actions, self.terminal.font().pointSize())
+        self._update_menu_checkmarks(self._baud_rate_actions, self.config.baudrate)
+
+        # Disable if only one pane remains
+        self._menu_close_action.setEnabled(not (self.container and len(self.container.panes) <= 1))
+        self._menu_copy_action.setEnabled(self.terminal.textCursor().hasSelection())
+
+    def _update_menu_checkmarks(self, actions: Dict[int, QAction], current):
+        """Show the checkbox icon only on the action matching current"""
+        checked_icon = self.checkbox_icon(True)
+        for value, action in actions.items():
+            action.setIcon(checked_icon if value == current else QIcon())
+
+    # Menu dispatch slots - the triggering action carries its value in data()
+    def _on_font_size_action(self):
+        self._set_font_size(self.sender().data())
+
+    def _on_baud_rate_action(self):
+        self._set_baud_rate(self.sender().data())
+
+    def _on_com_port_action(self):
+        self._set_com_port(self.sender().data())
+
+    def _on_split_action(self):
+        self.splitRequested.emit(self, self.sender().data())
+
+    def _on_close_action(self):
+        self.closeRequested.emit(self)
+
+    def _toggle_connection_from_menu(self):
+        """Connect or disconnect depending on current state"""
+        if self.is_connected:
+            self.disconnect()
+        else:
+            self.connect()
     
     def _create_terminal_menu(self) -> QMenu:
         """Create terminal menu matching main GUI style"""
@@ -264,12 +801,8 @@ class TerminalPane(QWidget):
         # Connection section
         # menu.addAction("Connection").setEnabled(False)
         
-        if self.is_connected:
-            disconnect = menu.addAction("Disconnect")
-            disconnect.triggered.connect(self.disconnect)
-        else:
-            connect = menu.addAction("Connect")
-            connect.triggered.connect(self.connect)
+        self._menu_connect_action = menu.addAction("Disconnect" if self.is_connected else "Connect")
+        self._menu_connect_action.triggered.connect(self._toggle_connection_from_menu)
 
         # Display Settings section
         # menu.addAction("Display Settings").setEnabled(False)
@@ -279,18 +812,21 @@ class TerminalPane(QWidget):
             "Auto-scroll"
         )
         auto_scroll.triggered.connect(lambda: self._toggle_auto_scroll(not self.formatter.is_auto_scroll_enabled()))
+        self._menu_auto_scroll_action = auto_scroll
         
         hex_mode = menu.addAction(
             self.checkbox_icon(self.hex_display_mode), 
             "Hex Display Mode"
         )
         hex_mode.triggered.connect(lambda: self._toggle_hex_mode(not self.hex_display_mode))
+        self._menu_hex_action = hex_mode
         
         local_echo = menu.addAction(
             self.checkbox_icon(self.local_echo_enabled), 
             "Local Echo"
         )
         local_echo.triggered.connect(lambda: self._toggle_local_echo(not self.local_echo_enabled))
+        self._menu_local_echo_action = local_echo
         
         menu.addSeparator()
         
@@ -305,9 +841,9 @@ class TerminalPane(QWidget):
         baud_menu = menu.addMenu("Baud Rate")
         self._create_baud_rate_menu(baud_menu)
         
-        # COM port submenu
-        com_menu = menu.addMenu("Switch COM Port")
-        self._create_com_port_menu(com_menu)
+        # COM port submenu - refreshed from the port cache each time it opens
+        self._com_menu = menu.addMenu("Switch COM Port")
+        self._com_menu.aboutToShow.connect(self._rebuild_com_port_menu)
         
         clear = menu.addAction("Clear Terminal")
         clear.triggered.connect(self._clear_terminal)
@@ -322,18 +858,21 @@ class TerminalPane(QWidget):
         
         split_v = menu.addAction("Split Pane Vertically")
         split_v.setShortcut("Alt+Shift+-")
-        split_v.triggered.connect(lambda: self.splitRequested.emit(self, 'vertical'))
+        split_v.setData('vertical')
+        split_v.triggered.connect(self._on_split_action)
         
         split_h = menu.addAction("Split Pane Horizontally")
         split_h.setShortcut("Alt+Shift++")
-        split_h.triggered.connect(lambda: self.splitRequested.emit(self, 'horizontal'))
+        split_h.setData('horizontal')
+        split_h.triggered.connect(self._on_split_action)
         
         close = menu.addAction("Close Pane")
         close.setShortcut("Ctrl+Shift+W")
-        close.triggered.connect(lambda: self.closeRequested.emit(self))
+        close.triggered.connect(self._on_close_action)
         # Disable if only one pane remains
         if self.container and len(self.container.panes) <= 1:
             close.setEnabled(False)
+        self._menu_close_action = close
         
         menu.addSeparator()
         
@@ -344,6 +883,7 @@ class TerminalPane(QWidget):
         copy.setShortcut("Ctrl+C")
         copy.triggered.connect(self.terminal.copy)
         copy.setEnabled(self.terminal.textCursor().hasSelection())
+        self._menu_copy_action = copy
         
         select_all = menu.addAction("Select All")
         select_all.setShortcut("Ctrl+A")
@@ -396,59 +936,38 @@ class TerminalPane(QWidget):
             "help"
         )
         
-        help_sections = [
-            ("CONNECTION", [
-                "- Auto-detects baud rate",
-                "- Supports standard serial protocols",
-                "- Real-time data display"
-            ]),
-            ("DISPLAY OPTIONS", [
-                "- Auto-scroll: Enabled by default",
-                "- Hex Display Mode: Show data as hex",
-                "- Local Echo: Echo typed characters"
-            ]),
-            ("DEFAULTS", [
-                "- Baud Rate: 115200",
-                "- Data Bits: 8",
-                "- Parity: None",
-                "- Stop Bits: 1",
-                "- Font Size: 10pt"
-            ]),
-            ("KEYBOARD SHORTCUTS", [
-                "Navigation:",
-                "- Alt+Arrow Keys: Navigate between panes",
-                "- Ctrl+Tab: Next tab",
-                "- Ctrl+Shift+Tab: Previous tab",
-                "",
-                "Pane Management:",
-                "- Alt+Shift+-: Split pane vertically",
-                "- Alt+Shift++: Split pane horizontally",
-                "- Ctrl+Shift+W: Close current pane",
-                "",
-                "Terminal Actions:",
-                "- Ctrl+C: Copy selected text",
-                "- Ctrl+A: Select all text",
-                "- Ctrl++: Increase font size",
-                "- Ctrl+-: Decrease font size",
-                "",
-                "Window Management:",
-                "- Ctrl+N: New connection",
-                "- Ctrl+W: Close current tab",
-                "- F1: Show this help"
-            ])
-        ]
-        
         cursor = self.terminal.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertFragment(self._build_help_fragment())
         
-        for section_title, section_items in help_sections:
+        # Add final [HELP] marker
+        self.formatter.append_status(
+            self.terminal,
+            "End Of Help Content - Press ESC to return to auto-scroll mode",
+            "help"
+        )
+        
+        # End help display
+        self.formatter.append_separator(self.terminal)
+    
+    def _build_help_fragment(self) -> QTextDocumentFragment:
+        """Compose the help body once as a document fragment for a single insert"""
+        if self._help_fragment is not None:
+            return self._help_fragment
+        
+        doc = QTextDocument()
+        cursor = QTextCursor(doc)
+        header_format = self.formatter._get_format('help', bold=True)
+        item_format = self.formatter._get_format('help')
+        
+        for section_title, section_items in self.HELP_SECTIONS:
             # Add section header without [HELP] prefix
-            cursor.insertText(f"\n{section_title}\n", self.formatter._get_format('help', bold=True))
+            cursor.insertText(f"\n{section_title}\n", header_format)
             
             # Add section items without [HELP] prefix
             for item in section_items:
                 if item:  # Skip empty lines
-                    cursor.insertText(f"{item}\n", self.formatter._get_format('help'))
+                    cursor.insertText(f"{item}\n", item_format)
                 else:
                     # Add empty line for spacing
                     cursor.insertText("\n")
@@ -456,15 +975,8 @@ class TerminalPane(QWidget):
             # Add spacing between sections
             cursor.insertText("\n")
         
-        # Add final [HELP] marker
-        self.formatter.append_status(
-            self.terminal,
-            "End Of Help Content - Press ESC to return to auto-scroll mode",
-            "help"
-        )
-        
-        # End help display
-        self.formatter.append_separator(self.terminal)
+        self._help_fragment = QTextDocumentFragment(doc)
+        return self._help_fragment
     
     def _dismiss_help(self):
         """Dismiss help display and restore auto-scroll state"""
@@ -500,12 +1012,15 @@ class TerminalPane(QWidget):
         # Common sizes
         common_sizes = [8, 10, 12, 14, 16]
         current_size = self.terminal.font().pointSize()
+        self._font_size_actions: Dict[int, QAction] = {}
         
         for size in common_sizes:
             action = menu.addAction(f"{size}pt")
-            action.triggered.connect(lambda checked, s=size: self._set_font_size(s))
+            action.setData(size)
+            action.triggered.connect(self._on_font_size_action)
             if size == current_size:
                 action.setIcon(self.checkbox_icon(True))
+            self._font_size_actions[size] = action
         
         menu.addSeparator()
         
@@ -514,9 +1029,11 @@ class TerminalPane(QWidget):
         for size in range(6, 25):
             if size not in common_sizes:
                 action = all_sizes_menu.addAction(f"{size}pt")
-                action.triggered.connect(lambda checked, s=size: self._set_font_size(s))
+                action.setData(size)
+                action.triggered.connect(self._on_font_size_action)
                 if size == current_size:
                     action.setIcon(self.checkbox_icon(True))
+                self._font_size_actions[size] = action
         
         menu.addSeparator()
         
@@ -539,40 +1056,42 @@ class TerminalPane(QWidget):
         # Standard baud rates
         standard_rates = [9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600]
         current_baud = self.config.baudrate
+        self._baud_rate_actions: Dict[int, QAction] = {}
         
         for rate in standard_rates:
             action = menu.addAction(f"{rate}")
-            action.triggered.connect(lambda checked, r=rate: self._set_baud_rate(r))
+            action.setData(rate)
+            action.triggered.connect(self._on_baud_rate_action)
             if rate == current_baud:
                 action.setIcon(self.checkbox_icon(True))
+            self._baud_rate_actions[rate] = action
+
+    def _rebuild_com_port_menu(self):
+        """Repopulate the COM port submenu from the cache, scanning in the background if stale"""
+        menu = self._com_menu
+        menu.clear()
+
+        available_ports = _get_cached_com_ports()
+        if available_ports is not None:
+            self._create_com_port_menu(menu, available_ports)
+            return
+
+        scanning = menu.addAction("Scanning ports...")
+        scanning.setEnabled(False)
+        if not self._port_scan_pending:
+            self._port_scan_pending = True
+            QThreadPool.globalInstance().start(PortScanTask(self._port_scan_signals))
+
+    def _on_com_ports_scanned(self, available_ports: list):
+        """Fill the COM port submenu once the background scan completes"""
+        self._port_scan_pending = False
+        if self._menu is not None:
+            self._com_menu.clear()
+            self._create_com_port_menu(self._com_menu, available_ports)
     
-    def _create_com_port_menu(self, menu: QMenu):
+    def _create_com_port_menu(self, menu: QMenu, available_ports: list):
         """Create COM port submenu with available ports and current selection indicator"""
         try:
-            # Get available ports using PortScanner
-            scanner = PortScanner()
-            available_ports = scanner.scan_registry_ports()
-            
-            # Fall back to serial.tools.list_ports if registry scan fails
-            if not available_ports:
-                try:
-                    import serial.tools.list_ports
-                    serial_ports = serial.tools.list_ports.comports()
-                    # Convert to our expected format
-                    available_ports = []
-                    for port in serial_ports:
-                        # Create a simple object with the required attributes
-                        class SimplePort:
-                            def __init__(self, device, description):
-                                self.port_name = device
-                                self.device_name = description or "Unknown"
-                                self.is_moxa = False
-                                self.port_type = "Hardware"
-                        
-                        available_ports.append(SimplePort(port.device, port.description))
-                except Exception:
-                    available_ports = []
-            
             current_port = self.config.port
             
             # Get connected ports from main window if available
@@ -590,7 +1109,7 @@ class TerminalPane(QWidget):
             
             # Add ports to menu with enhanced display format
             for port in available_ports:
-                display_name = self._create_com_port_display_text(port)
+                display_name = _port_display_text(port)
                 
                 # Check if port is in use by another pane
                 is_in_use_by_other = (port.port_name in connected_ports and 
@@ -600,7 +1119,8 @@ class TerminalPane(QWidget):
                     display_name += " (In Use)"
                 
                 action = menu.addAction(display_name)
-                action.triggered.connect(lambda checked, port_name=port.port_name: self._set_com_port(port_name))
+                action.setData(port.port_name)
+                action.triggered.connect(self._on_com_port_action)
                 
                 # Show checkbox for current port
                 if port.port_name == current_port:
@@ -614,50 +1134,19 @@ class TerminalPane(QWidget):
             error_action = menu.addAction(f"Error scanning ports: {str(e)}")
             error_action.setEnabled(False)
     
-    def _create_com_port_display_text(self, port):
-        """Create display text for COM port with type indicators"""
-        display_text = port.port_name
-        
-        if hasattr(port, 'is_moxa') and port.is_moxa:
-            display_text += "  •  Moxa"
-            if hasattr(port, 'device_name') and port.device_name and port.device_name != "Unknown":
-                display_text += f"  •  {port.device_name}"
-        elif hasattr(port, 'port_type') and port.port_type.startswith("Virtual"):
-            virtual_type = port.port_type.split(' ')[1] if ' ' in port.port_type else "Virtual"
-            display_text += f"  •  {virtual_type} Port"
-        else:
-            display_text += "  •  Hardware Port"
-            if hasattr(port, 'device_name') and port.device_name and port.device_name != "Unknown":
-                display_text += f"  •  {port.device_name}"
-        
-        return display_text
-    
     def checkbox_icon(self, checked: bool) -> QIcon:
-        """Generate checkbox icon using palette colors like VirtualPortManager"""
-        palette = self.palette()
-        border_color = palette.color(QPalette.ColorRole.Mid).name()
-        bg_color = palette.color(QPalette.ColorRole.Base).name()
-        check_color = palette.color(QPalette.ColorRole.Highlight).name()
-
-        if checked:
-            svg = f'''<svg width="16" height="16" xmlns="http://www.w3.org/2000/svg">
-                <rect x="0.5" y="0.5" width="15" height="15" fill="{border_color}" stroke="{border_color}" stroke-width="1"/>
-                <rect x="2" y="2" width="12" height="12" fill="{bg_color}"/>
-                <path d="M4 8l2 2 6-6" stroke="{check_color}" stroke-width="1.5" fill="none" stroke-linecap="round"/>
-            </svg>'''
-        else:
-            svg = f'''<svg width="16" height="16" xmlns="http://www.w3.org/2000/svg">
-                <rect x="0.5" y="0.5" width="15" height="15" fill="{border_color}" stroke="{border_color}" stroke-width="1"/>
-            </svg>'''
-        
-        renderer = QSvgRenderer(QByteArray(svg.encode()))
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-        return QIcon(pixmap)
-    
+        """Return the checked/unchecked icon for the current palette"""
+        if self._cb_icons is None:
+            palette = self.palette()
+            self._cb_icons = {True: _checkbox_icon(True, palette),
+                              False: _checkbox_icon(False, palette)}
+        return self._cb_icons[checked]
+
+    def changeEvent(self, event):
+        """Drop cached checkbox icons when the palette changes"""
+        if event.type() == QEvent.Type.PaletteChange:
+            self._cb_icons = None
+        super().changeEvent(event)
     
     def eventFilter(self, obj, event):
         """Handle focus events and keyboard input for local echo"""
@@ -684,16 +1173,16 @@ class TerminalPane(QWidget):
         text = event.text()
         
         # Handle special keys
-        if key == Qt.Key.Key_Return or key == Qt.Key.Key_Enter:
+        if key == self._K_RETURN or key == self._K_ENTER:
             # Send CRLF and create new line in display
             data_to_send = "\r\n"
             self._send_raw_data(data_to_send)
             self._echo_local_data(data_to_send)
             return True
-        elif key == Qt.Key.Key_Backspace:
+        elif key == self._K_BACKSPACE:
             # For now, just ignore backspace in local echo mode
             return True
-        elif key == Qt.Key.Key_Tab:
+        elif key == self._K_TAB:
             # Send tab character and echo locally
             data_to_send = "\t"
             self._send_raw_data(data_to_send)
@@ -712,7 +1201,7 @@ class TerminalPane(QWidget):
         """Send raw data to serial port without local echo formatting"""
         if self.serial_worker and self.is_connected:
             try:
-                bytes_data = data.encode(self.encoding)
+                bytes_data = self._encode(data)[0]
                 self.serial_worker.write(bytes_data)
                 self.tx_bytes += len(bytes_data)
             except UnicodeEncodeError as e:
@@ -727,13 +1216,8 @@ class TerminalPane(QWidget):
         cursor = self.terminal.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
         
-        # Set color for local echo (different from received data)
-        format = QTextCharFormat()
-        format.setForeground(QColor("#90EE90"))  # Light green for local echo
-        cursor.setCharFormat(format)
-        
-        # Insert the text
-        cursor.insertText(data)
+        # Insert the text in the local echo color (different from received data)
+        cursor.insertText(data, self._local_echo_format)
         
         # Auto-scroll if enabled
         if self.formatter.is_auto_scroll_enabled():
@@ -743,6 +1227,7 @@ class TerminalPane(QWidget):
         """Connect to serial port"""
         if not self.serial_worker:
             self.serial_worker = SerialWorker(self.config)
+            self.serial_worker.line_mode = not self.hex_display_mode
             # Use QueuedConnection to ensure thread-safe UI updates
             self.serial_worker.dataReceived.connect(
                 self._on_data_received, Qt.ConnectionType.QueuedConnection
@@ -755,6 +1240,12 @@ class TerminalPane(QWidget):
             )
             self.serial_worker.start()
             
+    def request_stop(self):
+        """Start stopping the serial worker without waiting; cleanup() then joins it"""
+        if self.serial_worker:
+            self.serial_worker.blockSignals(True)  # Same as cleanup STEP 3: no late deliveries
+            self.serial_worker.request_stop()
+    
     def disconnect(self):
         """Disconnect from serial port - ensures complete cleanup"""
         # Delegate to cleanup() - single source of truth for all cleanup logic
@@ -766,6 +1257,8 @@ class TerminalPane(QWidget):
         # This ensures toolbar/ribbon updates immediately without relying on signals
         old_is_connected = self.is_connected
         self.is_connected = False
+        if old_is_connected:
+            self.connectionChanged.emit(self, False)
 
         # STEP 2: Manually update toolbar/ribbon BEFORE we block signals
         # This ensures UI reflects disconnected state immediately (don't rely on signals)
@@ -782,7 +1275,7 @@ class TerminalPane(QWidget):
             self.serial_worker.blockSignals(True)
 
         # STEP 4: Stop and cleanup all timers (including disconnect timeout signals)
-        for timer in [self.pending_baud_timer, self.pending_port_timer, self.buffer_timer]:
+        for timer in [self.pending_baud_timer, self.pending_port_timer]:
             if timer:
                 try:
                     timer.stop()
@@ -794,6 +1287,8 @@ class TerminalPane(QWidget):
                 except (RuntimeError, AttributeError):
                     pass  # Timer already deleted
 
+        self._rx_timer.stop()
+
         # Clear timer references
         self.pending_baud_timer = None
         self.pending_port_timer = None
@@ -820,24 +1315,51 @@ class TerminalPane(QWidget):
             self.serial_worker = None
 
         # STEP 6: Clear buffer
-        self.line_buffer = ""
+        self._line_buf.clear()
+        self._hidden_dropped = 0
+        self._decoder.reset()
             
-    def _on_data_received(self, data: bytes):
-        """Handle received data with proper line buffering"""
+    def _on_data_received(self, data: bytes, raw_len: int):
+        """Queue received data (already split into lines by the worker) for display"""
         # Minimal guard - should never trigger if blockSignals works correctly (defense-in-depth)
         if not self.serial_worker:
             return
 
         # This method is called from worker thread via Qt signal/slot
         # Qt automatically handles thread safety for signal/slot connections
+        self.rx_bytes += raw_len
+
+        # Add to line buffer; it is decoded and displayed once per coalescing window
+        self._line_buf.extend(data)
+        if not self._rx_timer.isActive():
+            self._rx_timer.start(self.RX_COALESCE_MS)
+
+    def _process_rx(self):
+        """Decode and display the data gathered since the last pass"""
+        if not self.isVisible():
+            self._trim_hidden_backlog()
+            return  # Rendered by showEvent once the pane is on screen
+
+        if self._hidden_dropped:
+            self.formatter.append_status(
+                self.terminal,
+                f"[... {self._hidden_dropped} bytes dropped while hidden ...]",
+                "warning"
+            )
+            self._hidden_dropped = 0
+        
         try:
-            self.rx_bytes += len(data)
-            
             # Handle hex display mode
             if self.hex_display_mode:
-                hex_data = ' '.join(f'{b:02X}' for b in data)
-                ascii_data = ''.join(chr(b) if 32 <= b < 127 else '.' for b in data)
-                formatted_data = f"HEX: {hex_data} | ASCII: {ascii_data}"
+                data = bytes(self._line_buf)
+                self._line_buf.clear()
+                if not data:
+                    return
+                # Assemble the whole line as bytes and decode it once
+                formatted_data = b''.join((
+                    b"HEX: ", binascii.hexlify(data, b' ').upper(),
+                    b" | ASCII: ", data.translate(_PRINTABLE_ASCII)
+                )).decode('ascii')
                 
                 self.formatter.append_data(
                     self.terminal,
@@ -847,56 +1369,25 @@ class TerminalPane(QWidget):
                 )
                 return
             
-            # Decode bytes with proper error handling
-            try:
-                text_data = data.decode(self.encoding)
-                # Reset consecutive error count on successful decode
-                self.consecutive_errors = 0
-                # Gradually reduce error count on successful decodes
-                if self.encoding_error_count > 0:
-                    self.encoding_error_count = max(0, self.encoding_error_count - 1)
-            except UnicodeDecodeError:
-                self.consecutive_errors += 1
-                
-                # If too many consecutive errors, temporarily pause processing
-                if self.consecutive_errors >= self.max_consecutive_errors:
-                    self._handle_excessive_errors()
-                    return
-                
-                # Try with replacement characters
-                text_data = data.decode(self.encoding, errors='replace')
-                self._handle_encoding_error()
-                
-                # Skip processing obviously garbled data
-                if self._is_data_garbled(text_data):
-                    return
-            
-            # Normalize line endings
-            text_data = text_data.replace('\r\n', '\n').replace('\r', '\n')
-            
-            # Add to line buffer
-            self.line_buffer += text_data
-            
-            # Process complete lines
-            lines = self.line_buffer.split('\n')
-            
-            # Display all complete lines
-            for line in lines[:-1]:
-                if line:  # Only display non-empty lines
-                    self.formatter.append_data(
+            if not self._line_buf:
+                return
+            text_data = self._decode_data(bytes(self._line_buf))
+            self._line_buf.clear()
+            if text_data is not None:
+                # Display all lines with a single repaint
+                self.terminal.setUpdatesEnabled(False)
+                try:
+                    # Empty lines are skipped by the formatter
+                    self.formatter.append_lines(
                         self.terminal,
-                        line,
+                        text_data.split('\n'),
                         "incoming",
                         show_timestamp=True
                     )
-            
-            # Keep the last (potentially incomplete) line
-            self.line_buffer = lines[-1]
-            
-            # Start timer for incomplete lines
-            if self.line_buffer:
-                self.buffer_timer.stop()
-                self.buffer_timer.start(1000)  # 1 second timeout
+                finally:
+                    self.terminal.setUpdatesEnabled(True)
+                    if self.formatter.is_auto_scroll_enabled():
+                        self.terminal.ensureCursorVisible()
                 
         except (UnicodeDecodeError, UnicodeError) as e:
             self.formatter.append_status(
@@ -919,6 +1410,52 @@ class TerminalPane(QWidget):
                 "error"
             )
             
+    def _trim_hidden_backlog(self):
+        """Keep only the newest HIDDEN_BACKLOG_BYTES while the pane is off screen"""
+        excess = len(self._line_buf) - self.HIDDEN_BACKLOG_BYTES
+        if excess <= 0:
+            return
+        if not self.hex_display_mode:
+            # Cut on a line boundary so the first kept line is whole; with no
+            # newline left, keep the newest partial line as it is
+            newline = self._line_buf.find(b'\n', excess)
+            if newline != -1:
+                excess = newline + 1
+        del self._line_buf[:excess]
+        self._hidden_dropped += excess
+
+    def showEvent(self, event):
+        """Render data that arrived while the pane was hidden"""
+        super().showEvent(event)
+        if self._line_buf and not self._rx_timer.isActive():
+            self._rx_timer.start(0)
+
+    def _decode_data(self, data: bytes) -> Optional[str]:
+        """Decode received bytes, tracking encoding errors. Returns None if data should be skipped"""
+        try:
+            # Stateful decode: a code point split across reads is completed by the next call
+            text_data = self._decoder.decode(data)
+            # Reset consecutive error count on successful decode
+            self.consecutive_errors = 0
+            self._record_packet(0)
+        except UnicodeDecodeError:
+            self.consecutive_errors += 1
+            
+            # If too many consecutive errors, temporarily pause processing
+            if self.consecutive_errors >= self.max_consecutive_errors:
+                self._handle_excessive_errors()
+                return None
+            
+            # Try with replacement characters
+            self._decoder.reset()
+            text_data = data.decode(self.encoding, errors='replace')
+            self._handle_encoding_error()
+            
+            # Skip processing obviously garbled data
+            if self._is_data_garbled(text_data):
+                return None
+        return text_data
+
     def _on_error(self, error_msg: str):
         """Handle serial errors"""
         # Minimal guard - should never trigger if blockSignals works correctly (defense-in-depth)
@@ -936,6 +1473,7 @@ class TerminalPane(QWidget):
         if connected:
             # Connection SUCCESS - update state and show connection message
             self.is_connected = True
+            self.connectionChanged.emit(self, True)
             # Notify main window if this pane is active
             if self.main_window and hasattr(self.main_window, '_update_ribbon_connection_state'):
                 self.main_window._update_ribbon_connection_state()
@@ -957,7 +1495,7 @@ class TerminalPane(QWidget):
         """Send data to serial port"""
         if self.serial_worker and self.is_connected:
             try:
-                bytes_data = data.encode(self.encoding)
+                bytes_data = self._encode(data)[0]
                 self.serial_worker.write(bytes_data)
                 self.tx_bytes += len(bytes_data)
                 self.formatter.append_data(
@@ -974,7 +1512,14 @@ class TerminalPane(QWidget):
                 )
             
     def get_status_info(self) -> str:
-        """Get status information for status bar"""
+        """Get status information for status bar (reused until connection, port, baud, counts or echo change)"""
+        # Port and baud rate are the only config fields a pane changes after creation
+        key = (self.is_connected, self.config.port, self.config.baudrate,
+               self.rx_bytes, self.tx_bytes, self.local_echo_enabled)
+        cached = self._cached_status
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
         status = "Disconnected"
         if self.is_connected:
             status = "Connected"
@@ -984,27 +1529,13 @@ class TerminalPane(QWidget):
         
         echo_indicator = " | Local Echo: ON" if self.local_echo_enabled else " | Local Echo: OFF"
         
-        return f"{self.config.port}: {status} | {self.config.get_display_string()} | RX: {rx_str} | TX: {tx_str}{echo_indicator}"
+        text = f"{self.config.port}: {status} | {self.config.get_display_string()} | RX: {rx_str} | TX: {tx_str}{echo_indicator}"
+        self._cached_status = (key, text)
+        return text
     
     def _format_bytes(self, bytes_count: int) -> str:
         """Format byte count for display"""
-        if bytes_count < 1024:
-            return f"{bytes_count}B"
-        elif bytes_count < 1024 * 1024:
-            return f"{bytes_count / 1024:.1f}KB"
-        else:
-            return f"{bytes_count / (1024 * 1024):.1f}MB"
-    
-    def _flush_buffer(self):
-        """Flush remaining data in buffer"""
-        if self.line_buffer:
-            self.formatter.append_data(
-                self.terminal,
-                self.line_buffer,
-                "incoming",
-                show_timestamp=True
-            )
-            self.line_buffer = ""
+        return _format_byte_count(bytes_count)
     
     def _toggle_auto_scroll(self, enabled: bool):
         """Toggle auto-scroll with formatter integration"""
@@ -1015,6 +1546,8 @@ class TerminalPane(QWidget):
     def _toggle_hex_mode(self, enabled: bool):
         """Toggle hex display mode"""
         self.hex_display_mode = enabled
+        if self.serial_worker:
+            self.serial_worker.line_mode = not enabled
         if enabled:
             self.formatter.append_status(
                 self.terminal,
@@ -1056,8 +1589,10 @@ class TerminalPane(QWidget):
         self.formatter.clear(self.terminal)
         
         # Clear the data buffer as well
-        self.line_buffer = ""
-        self.buffer_timer.stop()
+        self._line_buf.clear()
+        self._hidden_dropped = 0
+        self._decoder.reset()
+        self._rx_timer.stop()
         
         # Reset help display state
         self.help_displayed = False
@@ -1301,39 +1836,42 @@ class TerminalPane(QWidget):
                     "error"
                 )
     
+    def _record_packet(self, error: int):
+        """Push a packet result into the error window, keeping a running sum"""
+        window = self._error_window
+        if len(window) == window.maxlen:
+            self.encoding_error_count -= window[0]  # Evicted by the append below
+        window.append(error)
+        self.encoding_error_count += error
+    
     def _handle_encoding_error(self):
         """Handle encoding errors with intelligent baud rate detection"""
-        import time
+        self._record_packet(1)
         
-        self.encoding_error_count += 1
-        self.data_packet_count += 1
+        # Calculate error rate once the window is full
+        if len(self._error_window) < self.encoding_error_window:
+            return
         
-        # Calculate error rate
-        if self.data_packet_count >= self.encoding_error_window:
-            error_rate = self.encoding_error_count / self.data_packet_count
-            current_time = time.time()
-            
-            # Check if we should show a warning
-            if (error_rate >= self.encoding_error_threshold and 
-                current_time - self.last_encoding_warning >= self.encoding_warning_interval):
-                
-                self.last_encoding_warning = current_time
-                
-                # Show baud rate suggestion if not already shown
-                if not self.baud_rate_suggestion_shown:
-                    self._show_baud_rate_suggestion(error_rate)
-                else:
-                    # Just show a brief warning
-                    self.formatter.append_status(
-                        self.terminal,
-                        f"High encoding error rate: {error_rate:.1%} - Check baud rate setting",
-                        "warning"
-                    )
+        # Warnings are rate limited, so skip the rate check until one could be shown
+        current_time = time.monotonic()
+        if current_time - self.last_encoding_warning < self.encoding_warning_interval:
+            return
+        
+        # Check if we should show a warning
+        error_rate = self.encoding_error_count / len(self._error_window)
+        if error_rate >= self.encoding_error_threshold:
+            self.last_encoding_warning = current_time
             
-            # Reset counters after window
-            if self.data_packet_count >= self.encoding_error_window * 2:
-                self.encoding_error_count = max(0, self.encoding_error_count // 2)
-                self.data_packet_count = self.encoding_error_window
+            # Show baud rate suggestion if not already shown
+            if not self.baud_rate_suggestion_shown:
+                self._show_baud_rate_suggestion(error_rate)
+            else:
+                # Just show a brief warning
+                self.formatter.append_status(
+                    self.terminal,
+                    f"High encoding error rate: {error_rate:.1%} - Check baud rate setting",
+                    "warning"
+                )
     
     def _show_baud_rate_suggestion(self, error_rate: float):
         """Show baud rate suggestion based on error patterns"""
@@ -1342,20 +1880,16 @@ class TerminalPane(QWidget):
         current_baud = self.config.baudrate
         
         # Find current baud rate index
-        current_index = -1
-        for i, rate in enumerate(self.suggested_baud_rates):
-            if rate == current_baud:
-                current_index = i
-                break
+        current_index = self._BAUD_RATE_INDEX.get(current_baud, -1)
         
         # Suggest common alternatives based on typical usage
         suggestions = []
         
         # Add adjacent rates
         if current_index > 0:
-            suggestions.append(self.suggested_baud_rates[current_index - 1])
-        if current_index < len(self.suggested_baud_rates) - 1:
-            suggestions.append(self.suggested_baud_rates[current_index + 1])
+            suggestions.append(self.SUGGESTED_BAUD_RATES[current_index - 1])
+        if current_index < len(self.SUGGESTED_BAUD_RATES) - 1:
+            suggestions.append(self.SUGGESTED_BAUD_RATES[current_index + 1])
         
         # Add most common fallbacks
         common_rates = [9600, 115200, 38400]  # Most common rates
@@ -1391,7 +1925,8 @@ class TerminalPane(QWidget):
     def reset_baud_rate_detection(self):
         """Reset baud rate detection counters (call when baud rate changes)"""
         self.encoding_error_count = 0
-        self.data_packet_count = 0
+        self._error_window.clear()
+        self._decoder.reset()
         self.baud_rate_suggestion_shown = False
         self.last_encoding_warning = 0
         self.consecutive_errors = 0
@@ -1443,7 +1978,11 @@ class TerminalPane(QWidget):
             return True
         
         # Check for excessive non-printable characters
-        printable_count = sum(1 for c in text_data if c.isprintable() or c in '\r\n\t')
+        if text_data.isascii():
+            # Delete printable characters in C; what remains is non-printable
+            printable_count = len(text_data) - len(text_data.translate(_ASCII_PRINTABLE_DELETE))
+        else:
+            printable_count = sum(1 for c in text_data if c.isprintable() or c in '\r\n\t')
         if len(text_data) > 0 and printable_count / len(text_data) < 0.3:  # Less than 30% printable
             return True
         
@@ -1455,10 +1994,18 @@ class WelcomeConfigWidget(QWidget):
     
     connectionRequested = pyqtSignal(object)  # SerialConfig
     
-    def __init__(self, parent=None):
+    _is_welcome = True  # Role tag checked by the main window instead of the tab title
+    
+    def __init__(self, parent=None, available_ports=None, main_window=None):
         super().__init__(parent)
         self.advanced_visible = False
-  # Store enhanced port information
+        self.available_ports = available_ports  # Pre-enumerated serial.tools ports, used once
+        self._port_scan_pending = False
+        self._port_scan_signals = PortScanSignals(self)
+        self._port_scan_signals.finished.connect(self._on_ports_scanned)
+        if main_window is not None:
+            # Window-wide refreshes scan once and push the result to every welcome widget
+            main_window.portsRefreshed.connect(self._on_ports_scanned)
         self._setup_ui()
         self._populate_ports()
         
@@ -1515,9 +2062,9 @@ class WelcomeConfigWidget(QWidget):
         connect_layout = QHBoxLayout()
         connect_layout.addStretch()  # Push button to the right
 
-        # Connect button using RibbonButton class for consistency
-        from ui.components import RibbonButton
-        self.connect_btn = RibbonButton("Connect", "enable")
+        # Connect button using the ribbon button factory for consistency
+        from ui.components import make_ribbon_button
+        self.connect_btn = make_ribbon_button("Connect", "enable")
         self.connect_btn.setToolTip("Start new serial terminal session")
         self.connect_btn.clicked.connect(self._handle_connect)
         
@@ -1530,79 +2077,42 @@ class WelcomeConfigWidget(QWidget):
         self.form_layout.addRow(connect_widget)
         
         
-    def _populate_ports(self):
+    def _populate_ports(self, force: bool = False):
         """Populate available serial ports using enhanced registry scanning"""
+        # A fresh cached scan is shown immediately
+        ports = None if force else _get_cached_com_ports()
+        if ports is not None:
+            self._on_ports_scanned(ports)
+            return
+        
         # Clear current ports
         self.port_combo.clear()
         self.port_combo.addItem("Scanning ports...")
-        self.connect_btn.setEnabled(False)
+        _set_enabled_if_changed(self.connect_btn, False)
         
-        # Use direct port scanning for fast terminal loading
-        self._scan_ports_direct()
+        self._scan_ports_direct(force)
     
-    def _scan_ports_direct(self):
-        """Direct port scanning for fast terminal loading"""
-        self._fallback_to_basic_scan()
+    def _scan_ports_direct(self, force: bool = False):
+        """Scan ports on the thread pool; results arrive in _on_ports_scanned"""
+        if self._port_scan_pending:
+            return
+        self._port_scan_pending = True
+        QThreadPool.globalInstance().start(
+            PortScanTask(self._port_scan_signals, force, self.available_ports)
+        )
+        self.available_ports = None  # Startup ports only seed the first scan
     
-    def _fallback_to_basic_scan(self):
-        """Direct port detection using existing PortScanner registry logic"""
-        self.port_combo.clear()
+    def _on_ports_scanned(self, ports: list):
+        """Fill the port list from scan results (registry first, serial.tools fallback)"""
+        self._port_scan_pending = False
         
-        try:
-            # Use existing PortScanner class for synchronous registry scanning
-            scanner = PortScanner()
-            ports = scanner.scan_registry_ports()
-            
-            if ports:
-                for port in ports:
-                    display_name = self._create_port_display_text(port)
-                    self.port_combo.addItem(display_name, port.port_name)
-                self.connect_btn.setEnabled(True)
-            else:
-                # Fallback to basic serial.tools if registry scan fails
-                self._basic_serial_scan()
-        except Exception as e:
-            print(f"Error scanning registry ports: {e}")
-            # Fallback to basic serial.tools scanning
-            self._basic_serial_scan()
-    
-    def _basic_serial_scan(self):
-        """Fallback to basic serial.tools.list_ports when registry scanning fails"""
-        try:
-            ports = serial.tools.list_ports.comports()
-            
-            if ports:
-                for port in ports:
-                    display_name = f"{port.device}"
-                    if port.description and port.description != "n/a":
-                        display_name += f" - {port.description}"
-                    self.port_combo.addItem(display_name, port.device)
-                self.connect_btn.setEnabled(True)
-            else:
-                self.port_combo.addItem("No ports available")
-                self.connect_btn.setEnabled(False)
-        except Exception as e:
-            print(f"Error with basic port scan: {e}")
-            self.port_combo.addItem("Port scanning failed")
-            self.connect_btn.setEnabled(False)
-    
-    def _create_port_display_text(self, port):
-        """Create display text for SerialPortInfo objects with type indicators"""
-        display_text = port.port_name
-        
-        if port.is_moxa:
-            display_text += "  •  Moxa"
-            if port.device_name and port.device_name != "Unknown":
-                display_text += f"  •  {port.device_name}"
-        elif port.port_type.startswith("Virtual"):
-            virtual_type = port.port_type.split(' ')[1] if ' ' in port.port_type else "Virtual"
-            display_text += f"  •  {virtual_type} Port"
+        if ports:
+            _fill_port_combo(self.port_combo, ports, _port_display_text)
+            _set_enabled_if_changed(self.connect_btn, True)
         else:
-            display_text += "  •  Hardware Port"
-            if port.device_name and port.device_name != "Unknown":
-                display_text += f"  •  {port.device_name}"
-        
-        return display_text
+            self.port_combo.clear()
+            self.port_combo.addItem("No ports available")
+            _set_enabled_if_changed(self.connect_btn, False)
     
             
     def _handle_connect(self):
@@ -1656,6 +2166,7 @@ class SplitContainer(QWidget):
         super().__init__(parent)
         self.panes: List[TerminalPane] = []
         self.active_pane: Optional[TerminalPane] = None
+        self._active_index = -1  # Position of active_pane in self.panes, -1 if none
         self.main_window = main_window
         self._setup_ui(initial_config)
         
@@ -1674,7 +2185,9 @@ class SplitContainer(QWidget):
         pane = TerminalPane(config, main_window=self.main_window, container=self)
         pane.splitRequested.connect(self._split_pane)
         pane.closeRequested.connect(self._close_pane)
-        pane.focusChanged.connect(lambda focused: self._on_pane_focus(pane, focused))
+        if self.main_window:
+            pane.connectionChanged.connect(self.main_window._on_pane_connection_changed)
+        pane.focusChanged.connect(self._on_pane_focus_changed)
         
         self.panes.append(pane)
         return pane
@@ -1687,10 +2200,8 @@ class SplitContainer(QWidget):
         layout = QVBoxLayout(welcome_pane)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        welcome_widget = WelcomeConfigWidget()
-        welcome_widget.connectionRequested.connect(
-            lambda config: self._replace_welcome_with_terminal(welcome_pane, config)
-        )
+        welcome_widget = WelcomeConfigWidget(main_window=self.main_window)
+        welcome_widget.connectionRequested.connect(self._on_welcome_connection_requested)
         
         layout.addWidget(welcome_widget)
         
@@ -1698,6 +2209,12 @@ class SplitContainer(QWidget):
         # We'll handle this specially in the container
         return welcome_pane
         
+    def _on_welcome_connection_requested(self, config: SerialConfig):
+        """Replace the requesting welcome widget's pane (its parent) with a terminal"""
+        welcome_widget = self.sender()
+        if welcome_widget is not None:
+            self._replace_welcome_with_terminal(welcome_widget.parentWidget(), config)
+        
     def _replace_welcome_with_terminal(self, welcome_pane, config: SerialConfig):
         """Replace welcome pane with actual terminal pane"""
         # Find the parent splitter
@@ -1714,7 +2231,7 @@ class SplitContainer(QWidget):
             
             # Connect and focus new pane
             terminal_pane.connect()
-            terminal_pane.terminal.setFocus()
+            _set_focus_if_needed(terminal_pane.terminal)
             self._set_active_pane(terminal_pane)
         
     def _split_pane(self, source_pane: TerminalPane, direction: str):
@@ -1761,7 +2278,7 @@ class SplitContainer(QWidget):
             splitter.setSizes([500, 500])
         
         # Focus the new welcome pane
-        new_pane.setFocus()
+        _set_focus_if_needed(new_pane)
     
     def _create_splitter(self, orientation: Qt.Orientation) -> QSplitter:
         """Create a styled splitter"""
@@ -1769,6 +2286,14 @@ class SplitContainer(QWidget):
         splitter.setHandleWidth(4)
         return splitter
     
+    def request_stop(self):
+        """Ask every pane's worker to stop so a following cleanup() joins them in parallel"""
+        for pane in self.panes:
+            try:
+                pane.request_stop()
+            except Exception as e:
+                print(f"Error stopping pane: {e}")
+    
     def cleanup(self):
         """Single point of cleanup for split container"""
         # Clean up all panes in the container
@@ -1781,6 +2306,7 @@ class SplitContainer(QWidget):
         # Clear the panes list
         self.panes.clear()
         self.active_pane = None
+        self._active_index = -1
         
     def _close_pane(self, pane: TerminalPane):
         """Close a pane and reorganize layout"""
@@ -1793,6 +2319,7 @@ class SplitContainer(QWidget):
         
         # Remove from list
         self.panes.remove(pane)
+        self._active_index = self.panes.index(self.active_pane) if self.active_pane in self.panes else -1
         
         # Find parent and remove
         parent = pane.parent()
@@ -1823,8 +2350,12 @@ class SplitContainer(QWidget):
         # Set new active pane
         if self.panes:
             self._set_active_pane(self.panes[0])
-            self.panes[0].terminal.setFocus()
+            _set_focus_if_needed(self.panes[0].terminal)
             
+    def _on_pane_focus_changed(self, focused: bool):
+        """Forward a pane's focusChanged, identifying the pane via sender()"""
+        self._on_pane_focus(self.sender(), focused)
+        
     def _on_pane_focus(self, pane: TerminalPane, focused: bool):
         """Handle pane focus changes"""
         if focused and pane in self.panes:
@@ -1833,21 +2364,21 @@ class SplitContainer(QWidget):
     def _set_active_pane(self, pane: TerminalPane):
         """Set the active pane"""
         self.active_pane = pane
+        self._active_index = self.panes.index(pane) if pane in self.panes else -1
         self.activePaneChanged.emit(pane)
         
     def navigate_panes(self, direction: str):
         """Navigate between panes using keyboard"""
-        if not self.active_pane or len(self.panes) < 2:
+        current_index = self._active_index
+        if current_index < 0 or len(self.panes) < 2:
             return
-            
-        current_index = self.panes.index(self.active_pane)
         
         if direction in ['left', 'up']:
             new_index = (current_index - 1) % len(self.panes)
         else:  # right, down
             new_index = (current_index + 1) % len(self.panes)
             
-        self.panes[new_index].terminal.setFocus()
+        _set_focus_if_needed(self.panes[new_index].terminal)
 
 # ===== CONNECTION DIALOG =====
 class QuickConnectDialog(QDialog):
@@ -1858,9 +2389,20 @@ class QuickConnectDialog(QDialog):
         self.setWindowTitle("New Connection")
         self.setModal(True)
         self.setFixedSize(400, 300)
-  # Store enhanced port information
-        self._setup_ui()
-        self._populate_ports()
+        self.scanned_ports = []  # Store enhanced port information
+        self.port_scanner: Optional[PortScanTask] = None  # Scan in flight, if any
+        self._port_scan_signals = PortScanSignals(self)
+        self._port_scan_signals.finished.connect(self._on_enhanced_ports_scanned)
+        self._port_scan_signals.finished.connect(self._on_scan_finished)
+        self._initialized = False  # Form and port scan are deferred to the first show
+    
+    def showEvent(self, event):
+        """Build the form and start the port scan the first time the dialog is shown"""
+        if not self._initialized:
+            self._initialized = True
+            self._setup_ui()
+            self._populate_ports()
+        super().showEvent(event)
         
     def _setup_ui(self):
         """Setup dialog UI - trust Fusion theme"""
@@ -1925,124 +2467,54 @@ class QuickConnectDialog(QDialog):
         button_layout.addWidget(self.connect_btn)
         layout.addLayout(button_layout)
         
-    def _populate_ports(self):
+    def _populate_ports(self, force: bool = False):
         """Populate available serial ports using enhanced registry scanning"""
+        # A fresh cached scan is shown immediately
+        ports = None if force else _get_cached_com_ports()
+        if ports is not None:
+            self._on_enhanced_ports_scanned(ports)
+            return
+        
         # Clear current ports
         self.port_combo.clear()
         self.port_combo.addItem("Scanning ports...")
-        self.connect_btn.setEnabled(False)
-        
-        # Use direct port scanning for fast terminal loading
-        self._scan_ports_direct()
-    
-    def _scan_ports_direct(self):
-        """Direct port scanning for fast terminal loading"""
-        self._fallback_to_basic_scan()
-    
-    def _fallback_to_basic_scan(self):
-        """Direct port detection using existing PortScanner registry logic"""
-        self.port_combo.clear()
+        _set_enabled_if_changed(self.connect_btn, False)
         
-        try:
-            # Use existing PortScanner class for synchronous registry scanning
-            scanner = PortScanner()
-            ports = scanner.scan_registry_ports()
-            
-            if ports:
-                for port in ports:
-                    display_name = self._create_port_display_text(port)
-                    self.port_combo.addItem(display_name, port.port_name)
-                self.connect_btn.setEnabled(True)
-            else:
-                # Fallback to basic serial.tools if registry scan fails
-                self._basic_serial_scan()
-        except Exception as e:
-            print(f"Error scanning registry ports: {e}")
-            # Fallback to basic serial.tools scanning
-            self._basic_serial_scan()
+        self._scan_ports_direct(force)
     
-    def _basic_serial_scan(self):
-        """Fallback to basic serial.tools.list_ports when registry scanning fails"""
-        try:
-            ports = serial.tools.list_ports.comports()
-            
-            if ports:
-                for port in ports:
-                    display_name = f"{port.device}"
-                    if port.description and port.description != "n/a":
-                        display_name += f" - {port.description}"
-                    self.port_combo.addItem(display_name, port.device)
-                self.connect_btn.setEnabled(True)
-            else:
-                self.port_combo.addItem("No ports available")
-                self.connect_btn.setEnabled(False)
-        except Exception as e:
-            print(f"Error with basic port scan: {e}")
-            self.port_combo.addItem("Port scanning failed")
-            self.connect_btn.setEnabled(False)
-    
-    def _create_port_display_text(self, port):
-        """Create display text for SerialPortInfo objects with type indicators"""
-        display_text = port.port_name
-        
-        if port.is_moxa:
-            display_text += "  •  Moxa"
-            if port.device_name and port.device_name != "Unknown":
-                display_text += f"  •  {port.device_name}"
-        elif port.port_type.startswith("Virtual"):
-            virtual_type = port.port_type.split(' ')[1] if ' ' in port.port_type else "Virtual"
-            display_text += f"  •  {virtual_type} Port"
-        else:
-            display_text += "  •  Hardware Port"
-            if port.device_name and port.device_name != "Unknown":
-                display_text += f"  •  {port.device_name}"
-        
-        return display_text
+    def _scan_ports_direct(self, force: bool = False):
+        """Scan ports on the thread pool; results arrive in _on_enhanced_ports_scanned"""
+        if self.port_scanner is not None:
+            return
+        self.port_scanner = PortScanTask(self._port_scan_signals, force)
+        QThreadPool.globalInstance().start(self.port_scanner)
     
     def _on_scan_progress(self, message):
         """Handle scan progress updates"""
-        # Update the first item to show progress
-        if self.port_combo.count() > 0:
-            self.port_combo.setItemText(0, message)
+        # Update the first item to show progress, unless the popup is open and would re-layout
+        if self.port_combo.count() > 0 and not self.port_combo.view().isVisible():
+            with QSignalBlocker(self.port_combo):
+                self.port_combo.setItemText(0, message)
     
     def _on_enhanced_ports_scanned(self, ports):
         """Handle enhanced port scan results"""
         self.scanned_ports = ports
-        self.port_combo.clear()
         
         if not ports:
-            self.port_combo.addItem("No ports available")
-            self.connect_btn.setEnabled(False)
+            with QSignalBlocker(self.port_combo):
+                self.port_combo.clear()
+                self.port_combo.addItem("No ports available")
+            _set_enabled_if_changed(self.connect_btn, False)
             return
         
         # Populate with enhanced port information
-        for port in ports:
-            display_text = self._create_enhanced_port_display_text(port)
-            self.port_combo.addItem(display_text, port.port_name)
+        _fill_port_combo(self.port_combo, ports, _port_display_text)
         
-        self.connect_btn.setEnabled(True)
+        _set_enabled_if_changed(self.connect_btn, True)
     
     def _on_scan_finished(self):
         """Handle scan completion"""
         self.port_scanner = None
-    
-    def _create_enhanced_port_display_text(self, port):
-        """Create enhanced display text for port with type indicators"""
-        display_text = port.port_name
-        
-        if port.is_moxa:
-            display_text += "  •  Moxa Device"
-            if port.device_name and port.device_name != "Unknown":
-                display_text += f"  •  {port.device_name}"
-        elif port.port_type.startswith("Virtual"):
-            virtual_type = port.port_type.split(' ')[1] if ' ' in port.port_type else "Virtual"
-            display_text += f"  •  {virtual_type} Port"
-        else:
-            display_text += "  •  Hardware Port"
-            if port.device_name and port.device_name != "Unknown":
-                display_text += f"  •  {port.device_name}"
-        
-        return display_text
             
     def get_config(self) -> SerialConfig:
         """Get the serial configuration from dialog"""
@@ -2098,36 +2570,38 @@ class QuickConnectDialog(QDialog):
     
     def _refresh_ports(self):
         """Refresh the ports list manually"""
-        self._populate_ports()
+        self._populate_ports(force=True)
     
     def cleanup(self):
-        """Clean up any running port scanner threads"""
-        if self.port_scanner and self.port_scanner.isRunning():
-            self.port_scanner.wait(1000)  # Wait up to 1 second for completion
+        """Drop the result of any scan still running on the thread pool"""
+        self._port_scan_signals.blockSignals(True)
+        self.port_scanner = None
 
 
 # ===== MAIN WINDOW =====
 class SerialMonitorWindow(QMainWindow):
     """Main window with tab management"""
     
-    def __init__(self):
+    portsRefreshed = pyqtSignal(list)  # Scan results for all welcome widgets
+    
+    _CLOSE_BUTTON_CSS = "border: none; background: transparent;"
+    
+    def __init__(self, available_ports=None):
         super().__init__()
         self.setWindowTitle("Serial Terminal")
         self.setMinimumSize(800, 600)
         
         # Set custom window icon using terminal settings icon
-        icon_pixmap = QPixmap(64, 64)
-        icon_pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(icon_pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        svg_renderer = QSvgRenderer()
-        svg_renderer.load(Icons.terminal_settings(self.palette()).encode())
-        svg_renderer.render(painter)
-        painter.end()
-        self.setWindowIcon(QIcon(icon_pixmap))
-        
-        self.tabs: Dict[QWidget, SplitContainer] = {}
-        self.close_button_icon = None  # Store close button icon
+        self.setWindowIcon(_render_svg_icon(Icons.terminal_settings(self.palette()).encode(), 64))
+        
+        self.tabs: List[SplitContainer] = []  # Connection tabs; the tab widget itself is the container
+        self._welcome_widget: Optional[WelcomeConfigWidget] = None  # Created on first use, then reused
+        self.close_button_icon = _render_svg_icon(_CLOSE_ICON_SVG)  # Rendered once, shared by all tabs
+        self.available_ports = available_ports  # Ports enumerated during startup
+        self._connected_ports: Dict[object, str] = {}  # pane -> port it connected on
+        self._port_scan_pending = False
+        self._port_scan_signals = PortScanSignals(self)
+        self._port_scan_signals.finished.connect(self._on_ports_refreshed)
         self._setup_ui()
         self._setup_shortcuts()
         self._apply_window_style()
@@ -2166,10 +2640,11 @@ class SerialMonitorWindow(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         
-        # Status update timer
+        # Status bar follows tab, active pane and connection changes; this slow timer
+        # only refreshes the RX/TX counters in between
         self.status_timer = QTimer()
         self.status_timer.timeout.connect(self._update_status_bar)
-        self.status_timer.start(1000)  # Update every second
+        self.status_timer.start(5000)
 
     def _connect_ribbon_signals(self):
         """Connect ribbon toolbar signals to existing methods."""
@@ -2181,29 +2656,7 @@ class SerialMonitorWindow(QMainWindow):
 
     def checkbox_icon(self, checked: bool) -> QIcon:
         """Generate checkbox icon using palette colors like VirtualPortManager"""
-        palette = self.palette()
-        border_color = palette.color(QPalette.ColorRole.Mid).name()
-        bg_color = palette.color(QPalette.ColorRole.Base).name()
-        check_color = palette.color(QPalette.ColorRole.Highlight).name()
-
-        if checked:
-            svg = f'''<svg width="16" height="16" xmlns="http://www.w3.org/2000/svg">
-                <rect x="0.5" y="0.5" width="15" height="15" fill="{border_color}" stroke="{border_color}" stroke-width="1"/>
-                <rect x="2" y="2" width="12" height="12" fill="{bg_color}"/>
-                <path d="M4 8l2 2 6-6" stroke="{check_color}" stroke-width="1.5" fill="none" stroke-linecap="round"/>
-            </svg>'''
-        else:
-            svg = f'''<svg width="16" height="16" xmlns="http://www.w3.org/2000/svg">
-                <rect x="0.5" y="0.5" width="15" height="15" fill="{border_color}" stroke="{border_color}" stroke-width="1"/>
-            </svg>'''
-        
-        renderer = QSvgRenderer(QByteArray(svg.encode()))
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-        return QIcon(pixmap)
+        return _checkbox_icon(checked, self.palette())
     
     def _setup_close_button_icon(self):
         """Set up custom close button - done in _apply_window_style"""
@@ -2221,37 +2674,26 @@ class SerialMonitorWindow(QMainWindow):
         tab_palette.setColor(QPalette.ColorRole.Base, window_bg)
         self.tab_widget.setPalette(tab_palette)
 
-        # Create custom white X close button icon
-        close_icon_svg = """<svg width="16" height="16" viewBox="0 0 16 16" xmlns="http://www.w3.org/2000/svg">
-            <line x1="4" y1="4" x2="12" y2="12" stroke="#ffffff" stroke-width="2" stroke-linecap="round"/>
-            <line x1="12" y1="4" x2="4" y2="12" stroke="#ffffff" stroke-width="2" stroke-linecap="round"/>
-        </svg>"""
-
-        renderer = QSvgRenderer(QByteArray(close_icon_svg.encode()))
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-
-        # Store the close button icon for reuse
-        self.close_button_icon = QIcon(pixmap)
-
-        # Apply to existing tabs
+        # Apply the custom close button icon to existing tabs
         self._apply_close_icon_to_tabs()
 
        
     def _apply_close_icon_to_tabs(self):
         """Apply custom close button icon to all tabs"""
+        for i in range(self.tab_widget.count()):
+            self._apply_close_icon_to_tab(i)
+
+    def _apply_close_icon_to_tab(self, index: int):
+        """Apply the shared close button icon to one (newly added) tab"""
         if not self.close_button_icon:
             return
 
-        for i in range(self.tab_widget.count()):
-            button = self.tab_widget.tabBar().tabButton(i, QTabBar.ButtonPosition.RightSide)
-            if button:
-                button.setIcon(self.close_button_icon)
-                button.setIconSize(QSize(12, 12))
-                button.setStyleSheet("border: none; background: transparent;")
+        button = self.tab_widget.tabBar().tabButton(index, QTabBar.ButtonPosition.RightSide)
+        # Skip a button that is already styled: setStyleSheet re-parses and repolishes
+        if button and button.styleSheet() != self._CLOSE_BUTTON_CSS:
+            button.setIcon(self.close_button_icon)
+            button.setIconSize(QSize(12, 12))
+            button.setStyleSheet(self._CLOSE_BUTTON_CSS)
 
     def _setup_shortcuts(self):
         """Setup global keyboard shortcuts"""
@@ -2281,10 +2723,19 @@ class SerialMonitorWindow(QMainWindow):
     
     def _refresh_ports(self):
         """Refresh ports in all welcome widgets"""
-        for i in range(self.tab_widget.count()):
-            widget = self.tab_widget.widget(i)
-            if isinstance(widget, WelcomeConfigWidget):
-                widget._populate_ports()
+        self._scan_once_async()
+    
+    def _scan_once_async(self):
+        """Run one forced port scan on the thread pool; results go out via portsRefreshed"""
+        if self._port_scan_pending:
+            return
+        self._port_scan_pending = True
+        QThreadPool.globalInstance().start(PortScanTask(self._port_scan_signals, force=True))
+    
+    def _on_ports_refreshed(self, ports: list):
+        """Forward a finished refresh scan to every subscribed welcome widget"""
+        self._port_scan_pending = False
+        self.portsRefreshed.emit(ports)
     
     def _show_welcome_tab(self):
         """Show welcome tab with responsive embedded port configuration"""
@@ -2293,42 +2744,60 @@ class SerialMonitorWindow(QMainWindow):
             return
             
         try:
-            welcome_widget = WelcomeConfigWidget()
-            welcome_widget.connectionRequested.connect(self._handle_welcome_connection)
+            if self._welcome_widget is None:
+                self._welcome_widget = WelcomeConfigWidget(available_ports=self.available_ports, main_window=self)
+                self.available_ports = None  # Only valid for the first welcome tab
+                self._welcome_widget.connectionRequested.connect(self._handle_welcome_connection)
+            else:
+                # Reused widget: cached ports if still fresh, otherwise a background rescan
+                self._welcome_widget._populate_ports()
             
-            index = self.tab_widget.addTab(welcome_widget, "New tab")
-            self.tab_widget.setCurrentIndex(index)
-            self._apply_close_icon_to_tabs()  # Apply custom close icon
+            with self._batched_tab_updates():
+                index = self.tab_widget.addTab(self._welcome_widget, "New tab")
+                self.tab_widget.setCurrentIndex(index)
+                self._apply_close_icon_to_tab(index)  # Apply custom close icon
         except Exception as e:
             print(f"Error creating welcome tab: {e}")
     
+    @contextlib.contextmanager
+    def _batched_tab_updates(self):
+        """Hold tab widget repaints until a multi-step tab change is done (nested use is a no-op)"""
+        if not self.tab_widget.updatesEnabled():
+            yield
+            return
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+    
     def _has_welcome_tab(self) -> bool:
         """Check if a welcome tab already exists"""
-        for i in range(self.tab_widget.count()):
-            if self.tab_widget.tabText(i) == "New tab":
-                return True
-        return False
+        return self._welcome_widget is not None and self.tab_widget.indexOf(self._welcome_widget) != -1
     
     def _handle_welcome_connection(self, config: SerialConfig):
         """Handle connection request from welcome widget"""
         try:
-            self._create_tab(config)
-            
-            # Remove welcome tab after successful connection
-            self._remove_welcome_tab()
+            with self._batched_tab_updates():
+                container = self._create_tab(config, auto_connect=False)
+                
+                # Remove welcome tab after successful connection
+                self._remove_welcome_tab()
+            self._connect_container(container)
         except Exception as e:
             print(f"Error handling welcome connection: {e}")
     
     def _remove_welcome_tab(self):
-        """Safely remove welcome tab"""
+        """Safely remove welcome tab, keeping its widget for the next one"""
         try:
-            for i in range(self.tab_widget.count()):
-                if self.tab_widget.tabText(i) == "New tab":
-                    widget = self.tab_widget.widget(i)
-                    self.tab_widget.removeTab(i)
-                    if widget:
-                        widget.deleteLater()
-                    break
+            widget = self._welcome_widget
+            if widget is None:
+                return
+            with self._batched_tab_updates():
+                index = self.tab_widget.indexOf(widget)
+                if index != -1:
+                    self.tab_widget.removeTab(index)
+                widget.setParent(None)
         except Exception as e:
             print(f"Error removing welcome tab: {e}")
     
@@ -2336,43 +2805,55 @@ class SerialMonitorWindow(QMainWindow):
         """Create new tab with welcome screen"""
         self._show_welcome_tab()
             
-    def _create_tab(self, config: SerialConfig):
+    def _create_tab(self, config: SerialConfig, auto_connect: bool = True) -> SplitContainer:
         """Create a new tab with split container"""
         # Create container
         container = SplitContainer(config, main_window=self)
         container.activePaneChanged.connect(self._on_active_pane_changed)
         
         # Store references
-        self.tabs[container] = container
+        self.tabs.append(container)
         
         # Add tab directly with the container
-        index = self.tab_widget.addTab(container, config.port)
-        self.tab_widget.setCurrentIndex(index)
-        self._apply_close_icon_to_tabs()  # Apply custom close icon
+        with self._batched_tab_updates():
+            index = self.tab_widget.addTab(container, config.port)
+            self.tab_widget.setCurrentIndex(index)
+            self._apply_close_icon_to_tab(index)  # Apply custom close icon
         
-        # Auto-connect the first pane
+        # Auto-connect the first pane (callers batching tab updates connect after the batch)
+        if auto_connect:
+            self._connect_container(container)
+        return container
+    
+    def _connect_container(self, container: SplitContainer):
+        """Connect a new tab's first pane"""
         if container.active_pane:
             container.active_pane.connect()
             
     def cleanup(self):
         """Cleanup all tabs"""
-        for container in self.tabs.values():
+        for container in self.tabs:
             container.cleanup()
     
     def get_all_active_panes(self):
         """Get all terminal panes across all containers"""
         all_panes = []
-        for container in self.tabs.values():
+        for container in self.tabs:
             all_panes.extend(container.panes)
         return all_panes
     
     def get_connected_ports(self):
         """Get set of all currently connected ports"""
-        connected_ports = set()
-        for pane in self.get_all_active_panes():
-            if pane.is_connected:
-                connected_ports.add(pane.config.port)
-        return connected_ports
+        return set(self._connected_ports.values())
+    
+    def _on_pane_connection_changed(self, pane, connected: bool):
+        """Track connected ports as panes connect and disconnect"""
+        if connected:
+            self._connected_ports[pane] = pane.config.port
+        else:
+            # Keyed by pane: its config.port may already point at the next port
+            self._connected_ports.pop(pane, None)
+        self._update_status_bar()
     
     def _close_tab(self, index: int):
         """Close a tab and cleanup"""
@@ -2384,27 +2865,26 @@ class SerialMonitorWindow(QMainWindow):
             return
             
         # Don't allow closing the last welcome tab if it's the only one
-        if (self.tab_widget.count() == 1 and 
-            self.tab_widget.tabText(index) == "New tab"):
+        is_welcome = getattr(widget, '_is_welcome', False)
+        if is_welcome and self.tab_widget.count() == 1:
             return
             
         # Check for active connections and cleanup
-        if widget in self.tabs:
-            container = self.tabs[widget]
-            
+        if isinstance(widget, SplitContainer):
             # Cleanup all panes
             try:
-                container.cleanup()
-                del self.tabs[widget]
+                widget.cleanup()
+                self.tabs.remove(widget)
             except Exception as e:
                 print(f"Error cleaning up container: {e}")
                 
-        # Remove tab and schedule widget deletion
-        self.tab_widget.removeTab(index)
-        
-        # Schedule widget deletion and check for empty tabs
-        if widget:
-            widget.deleteLater()
+        # Remove tab and schedule widget deletion (the welcome widget is kept for reuse)
+        with self._batched_tab_updates():
+            self.tab_widget.removeTab(index)
+            if is_welcome:
+                widget.setParent(None)
+            else:
+                widget.deleteLater()
             
         # Use QTimer to ensure the count is updated after widget deletion
         QTimer.singleShot(0, self._check_empty_tabs)
@@ -2441,7 +2921,7 @@ class SerialMonitorWindow(QMainWindow):
     def _get_current_container(self) -> Optional[SplitContainer]:
         """Get current tab's split container"""
         widget = self.tab_widget.currentWidget()
-        return self.tabs.get(widget)
+        return widget if isinstance(widget, SplitContainer) else None
         
     def _navigate_panes(self, direction: str):
         """Navigate panes in current tab"""
@@ -2536,8 +3016,11 @@ class SerialMonitorWindow(QMainWindow):
             # Stop the status timer
             self.status_timer.stop()
             
-            # Signal all workers to stop gracefully
-            for container in self.tabs.values():
+            # Signal all workers to stop first, then join them: the waits overlap
+            # instead of adding up tab by tab
+            for container in self.tabs:
+                container.request_stop()
+            for container in self.tabs:
                 container.cleanup()
             
             # Accept the event and let atexit handle final cleanup
@@ -2556,11 +3039,8 @@ class SerialMonitorWindow(QMainWindow):
             # Calculate menu position (show below the settings button in ribbon)
             button_global_pos = self.ribbon.settings_button.mapToGlobal(self.ribbon.settings_button.rect().bottomLeft())
 
-            # Create menu using the pane's method
-            menu = active_pane._create_terminal_menu()
-
-            # Show menu at calculated position
-            menu.exec(button_global_pos)
+            # Reuse the pane's cached context menu
+            active_pane.show_menu_at(button_global_pos)
         else:
             # Show a simple message if no active pane
             menu = QMenu(self)
@@ -14,7 +14,9 @@ import json
 import sys
 import tempfile
 import ctypes
+import functools
 from ctypes import wintypes
+from types import SimpleNamespace
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
 from enum import Enum
@@ -51,23 +53,46 @@ class SHELLEXECUTEINFO(ctypes.Structure):
         ('hProcess', wintypes.HANDLE),
     ]
 
-# Declare ShellExecuteEx function
-ShellExecuteEx = ctypes.windll.shell32.ShellExecuteExW
-ShellExecuteEx.argtypes = [ctypes.POINTER(SHELLEXECUTEINFO)]
-ShellExecuteEx.restype = wintypes.BOOL
-
-# Declare process wait functions
-WaitForSingleObject = ctypes.windll.kernel32.WaitForSingleObject
-WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
-WaitForSingleObject.restype = wintypes.DWORD
-
-GetExitCodeProcess = ctypes.windll.kernel32.GetExitCodeProcess
-GetExitCodeProcess.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
-GetExitCodeProcess.restype = wintypes.BOOL
-
-CloseHandle = ctypes.windll.kernel32.CloseHandle
-CloseHandle.argtypes = [wintypes.HANDLE]
-CloseHandle.restype = wintypes.BOOL
+@functools.cache
+def _win32() -> SimpleNamespace:
+    """Bind the shell32/kernel32 functions used for elevation on first use (Windows only)."""
+    if sys.platform != 'win32':
+        raise OSError("UAC elevation requires Windows")
+
+    # Private library handles so argtypes don't leak into ctypes.windll, and
+    # use_last_error so ctypes.get_last_error() reports ShellExecuteEx failures
+    shell32 = ctypes.WinDLL('shell32', use_last_error=True)
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+    # Declare ShellExecuteEx function
+    ShellExecuteEx = shell32.ShellExecuteExW
+    ShellExecuteEx.argtypes = [ctypes.POINTER(SHELLEXECUTEINFO)]
+    ShellExecuteEx.restype = wintypes.BOOL
+
+    # Declare process wait functions
+    WaitForSingleObject = kernel32.WaitForSingleObject
+    WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    WaitForSingleObject.restype = wintypes.DWORD
+
+    GetExitCodeProcess = kernel32.GetExitCodeProcess
+    GetExitCodeProcess.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
+    GetExitCodeProcess.restype = wintypes.BOOL
+
+    TerminateProcess = kernel32.TerminateProcess
+    TerminateProcess.argtypes = [wintypes.HANDLE, ctypes.c_uint]
+    TerminateProcess.restype = wintypes.BOOL
+
+    CloseHandle = kernel32.CloseHandle
+    CloseHandle.argtypes = [wintypes.HANDLE]
+    CloseHandle.restype = wintypes.BOOL
+
+    return SimpleNamespace(
+        ShellExecuteEx=ShellExecuteEx,
+        WaitForSingleObject=WaitForSingleObject,
+        GetExitCodeProcess=GetExitCodeProcess,
+        TerminateProcess=TerminateProcess,
+        CloseHandle=CloseHandle,
+    )
 
 # Constants for WaitForSingleObject
 WAIT_OBJECT_0 = 0x00000000
@@ -103,7 +128,7 @@ class PortStatus(Enum):
     UNKNOWN = "Unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Port:
     """Individual virtual port model."""
     identifier: str  # e.g., "CNCA0", "CNCB0"
@@ -111,7 +136,7 @@ class Port:
     parameters: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PortPair:
     """Virtual port pair model."""
     number: int
@@ -127,7 +152,7 @@ class PortPair:
             self.port_b.identifier = f"CNCB{self.number}"
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandResult:
     """Result of a setupc.exe command execution."""
     success: bool
@@ -149,77 +174,64 @@ class CommandResult:
             return "Unknown error occurred"
 
 
+# "CNCA0 PortName=COM8,EmuBR=yes": port side, pair number, parameter string.
+# Also the line filter: prompts, blank lines and other noise simply don't match.
+_LINE_RE = re.compile(r'\s*(CNC([AB])(\d+))(?:\s+(.*?))?\s*$')
+_PARAM_RE = re.compile(r'([^=,\s]+)=([^,]*)')
+
+# setupc's fixed parameter vocabulary; interned so every port's dict shares the key objects
+_KNOWN_KEYS = frozenset(map(sys.intern, (
+    'PortName', 'EmuBR', 'EmuOverrun', 'ExclusiveMode', 'PlugInMode',
+    'AllDataBits', 'cts', 'dsr', 'dcd', 'ri',
+)))
+
+
 class PortListParser:
     """Parser for setupc.exe list command output."""
 
     @staticmethod
     def parse_port_list(output: str) -> List[PortPair]:
         """Parse setupc.exe list output into PortPair objects."""
-        port_pairs = []
+        pairs_by_num: Dict[int, PortPair] = {}
 
-        for line in output.strip().split('\n'):
-            line = line.strip()
-            if not line or line.startswith('command>'):
+        for line in output.splitlines():
+            # Only port identifier lines (CNCA0, CNCB0, etc.) match
+            match = _LINE_RE.match(line)
+            if not match:
                 continue
 
-            # Look for port identifiers (CNCA0, CNCB0, etc.)
-            if line.startswith('CNC'):
-                parts = line.split()
-                if len(parts) >= 1:
-                    port_id = parts[0]
+            port_id, port_type, pair_num, params_str = match.groups()
+            pair_num = int(pair_num)
 
-                    # Validate port ID format before parsing
-                    if len(port_id) < 5 or port_id[3] not in ('A', 'B'):
-                        logger.warning(f"Skipping malformed port identifier: {port_id}")
-                        continue  # Skip malformed port identifier
+            # Find or create port pair
+            pair = pairs_by_num.get(pair_num)
+            if pair is None:
+                pair = pairs_by_num[pair_num] = PortPair(
+                    number=pair_num,
+                    port_a=Port(identifier=f"CNCA{pair_num}"),
+                    port_b=Port(identifier=f"CNCB{pair_num}"),
+                    status=PortStatus.ACTIVE
+                )
 
-                    try:
-                        # Extract pair number
-                        pair_num = int(port_id[4:])  # Skip "CNCA" or "CNCB"
-                        port_type = port_id[3]  # "A" or "B"
-                    except (ValueError, IndexError) as e:
-                        logger.warning(f"Failed to parse port identifier {port_id}: {e}")
-                        continue  # Skip if pair number is invalid
-
-                    # Find or create port pair
-                    pair = next((p for p in port_pairs if p.number == pair_num), None)
-                    if not pair:
-                        pair = PortPair(
-                            number=pair_num,
-                            port_a=Port(identifier=f"CNCA{pair_num}"),
-                            port_b=Port(identifier=f"CNCB{pair_num}"),
-                            status=PortStatus.ACTIVE
-                        )
-                        port_pairs.append(pair)
-
-                    # Set port data
-                    port = pair.port_a if port_type == 'A' else pair.port_b
-                    port.identifier = port_id
+            # Set port data
+            port = pair.port_a if port_type == 'A' else pair.port_b
+            port.identifier = port_id
 
-                    # Parse parameters from the rest of the line
-                    if len(parts) > 1:
-                        params_str = ' '.join(parts[1:])
-                        port.parameters = PortListParser._parse_parameters(params_str)
+            # Parse parameters from the rest of the line
+            if params_str:
+                port.parameters = PortListParser._parse_parameters(params_str)
 
-                        # Extract port name if present
-                        if 'PortName' in port.parameters:
-                            port.port_name = port.parameters['PortName']
+                # Extract port name if present
+                if 'PortName' in port.parameters:
+                    port.port_name = port.parameters['PortName']
 
-        return sorted(port_pairs, key=lambda p: p.number)
+        return sorted(pairs_by_num.values(), key=lambda p: p.number)
 
     @staticmethod
     def _parse_parameters(params_str: str) -> Dict[str, str]:
         """Parse parameter string into dictionary."""
-        parameters = {}
-
-        # Simple parameter parsing
-        for param in params_str.split(','):
-            param = param.strip()
-            if '=' in param:
-                key, value = param.split('=', 1)
-                parameters[key.strip()] = value.strip()
-
-        return parameters
+        return {(sys.intern(key) if key in _KNOWN_KEYS else key): value.strip()
+                for key, value in _PARAM_RE.findall(params_str)}
 
 
 # ============================================================================
@@ -340,6 +352,8 @@ class ElevatedHelperWorker(QThread):
         logger.debug(f"  File: {helper_path}")
         logger.debug(f"  Parameters: {parameters}")
 
+        win32 = _win32()
+
         # Initialize SHELLEXECUTEINFO structure
         sei = SHELLEXECUTEINFO()
         sei.cbSize = ctypes.sizeof(sei)
@@ -353,7 +367,7 @@ class ElevatedHelperWorker(QThread):
         sei.hProcess = None
 
         # Execute with elevation
-        if not ShellExecuteEx(ctypes.byref(sei)):
+        if not win32.ShellExecuteEx(ctypes.byref(sei)):
             error_code = ctypes.get_last_error()
             if error_code == 1223:  # ERROR_CANCELLED - User denied UAC
                 logger.warning("UAC prompt was denied by user")
@@ -374,21 +388,21 @@ class ElevatedHelperWorker(QThread):
         timeout_ms = uac_timeout * 1000
 
         logger.debug(f"Waiting for elevated process (timeout: {uac_timeout}s)")
-        wait_result = WaitForSingleObject(sei.hProcess, timeout_ms)
+        wait_result = win32.WaitForSingleObject(sei.hProcess, timeout_ms)
 
         if wait_result == WAIT_TIMEOUT:
             logger.error(f"Helper process timed out after {uac_timeout}s")
-            CloseHandle(sei.hProcess)
+            win32.CloseHandle(sei.hProcess)
             return -1, time.time() - start_time
 
         # Get exit code
         exit_code = wintypes.DWORD()
-        if not GetExitCodeProcess(sei.hProcess, ctypes.byref(exit_code)):
+        if not win32.GetExitCodeProcess(sei.hProcess, ctypes.byref(exit_code)):
             logger.error("Failed to get process exit code")
-            CloseHandle(sei.hProcess)
+            win32.CloseHandle(sei.hProcess)
             return -1, time.time() - start_time
 
-        CloseHandle(sei.hProcess)
+        win32.CloseHandle(sei.hProcess)
         execution_time = time.time() - start_time
 
         logger.debug(f"Elevated process completed with exit code {exit_code.value} in {execution_time:.2f}s")
@@ -515,19 +529,17 @@ class ElevatedHelperWorker(QThread):
     def terminate(self):
         """Terminate the helper process if running."""
         if self._process:
+            win32 = _win32()
             # Check if process is still running
             exit_code = wintypes.DWORD()
-            if GetExitCodeProcess(self._process, ctypes.byref(exit_code)):
+            if win32.GetExitCodeProcess(self._process, ctypes.byref(exit_code)):
                 STILL_ACTIVE = 259  # Windows constant for still-running process
                 if exit_code.value == STILL_ACTIVE:
                     logger.warning("Terminating elevated helper process")
                     # Terminate the process using Windows API
-                    TerminateProcess = ctypes.windll.kernel32.TerminateProcess
-                    TerminateProcess.argtypes = [wintypes.HANDLE, ctypes.c_uint]
-                    TerminateProcess.restype = wintypes.BOOL
-                    TerminateProcess(self._process, 1)
+                    win32.TerminateProcess(self._process, 1)
                 # Close handle
-                CloseHandle(self._process)
+                win32.CloseHandle(self._process)
                 self._process = None
         super().terminate()
 
@@ -540,14 +552,15 @@ class VirtualPortToolbar(QWidget):
     create_clicked = pyqtSignal()
     close_clicked = pyqtSignal()
 
-    def __init__(self, parent=None):
+    def __init__(self, parent, icons: dict):
         super().__init__(parent)
+        self.icons = icons  # Pre-rendered by the dialog; needs refresh, create and close
         self._setup_ui()
 
-    def _create_button(self, text: str, icon_svg: str, tooltip: str, callback) -> QPushButton:
+    def _create_button(self, text: str, icon: QIcon, tooltip: str, callback) -> QPushButton:
         """Create a toolbar button with icon and tooltip"""
         button = QPushButton(text)
-        button.setIcon(Icons.svg_to_icon(icon_svg))
+        button.setIcon(icon)
         button.setIconSize(QSize(16, 16))
         button.setToolTip(tooltip)
         button.clicked.connect(callback)
@@ -563,9 +576,9 @@ class VirtualPortToolbar(QWidget):
         layout.setContentsMargins(5, 5, 5, 5)
 
         # Create buttons
-        self.refresh_button = self._create_button("Refresh", Icons.refresh(), "Refresh port list", self.refresh_clicked.emit)
-        self.create_button = self._create_button("Create", Icons.create(), "Create new port pair", self.create_clicked.emit)
-        self.close_button = self._create_button("Close", Icons.close(), "Close Virtual Port Manager", self.close_clicked.emit)
+        self.refresh_button = self._create_button("Refresh", self.icons['refresh'], "Refresh port list", self.refresh_clicked)
+        self.create_button = self._create_button("Create", self.icons['create'], "Create new port pair", self.create_clicked)
+        self.close_button = self._create_button("Close", self.icons['close'], "Close Virtual Port Manager", self.close_clicked)
 
         layout.addWidget(self.refresh_button)
         layout.addWidget(self.create_button)
@@ -631,6 +644,7 @@ class VirtualPortDialog(QDialog):
         self._closing = False  # Flag to prevent operations during shutdown
         self._load_timer_id = None  # Track QTimer for cleanup
         self._dev_mode = not getattr(sys, 'frozen', False)  # Check if running as script
+        self.icons = Icons.build_all(('refresh', 'create', 'close', 'remove'))  # Toolbar and row icons, rendered once
 
         # Set window flags to show proper title bar with minimize/maximize/close buttons
         self.setWindowFlags(Qt.WindowType.Window | Qt.WindowType.WindowTitleHint |
@@ -658,7 +672,7 @@ class VirtualPortDialog(QDialog):
         main_layout.setContentsMargins(0, 0, 0, 0)
 
         # === Toolbar ===
-        self.toolbar = VirtualPortToolbar(self)
+        self.toolbar = VirtualPortToolbar(self, self.icons)
         main_layout.addWidget(self.toolbar)
 
         # === Port Pairs Table ===
@@ -810,7 +824,7 @@ class VirtualPortDialog(QDialog):
         port_b_name = pair.port_b.port_name or pair.port_b.identifier
 
         remove_button = QPushButton()
-        remove_button.setIcon(Icons.svg_to_icon(Icons.remove()))
+        remove_button.setIcon(self.icons['remove'])
         remove_button.setIconSize(QSize(20, 20))
         remove_button.setToolTip(f"Remove {port_a_name} ↔ {port_b_name}")
         remove_button.setMaximumWidth(100)
@@ -6,7 +6,7 @@ Handles icon management, asset paths, and custom font loading.
 import sys
 from pathlib import Path
 from typing import Optional, Dict, List
-from PyQt6.QtGui import QIcon, QPixmap, QFont, QFontDatabase
+from PyQt6.QtGui import QIcon, QPixmap, QPainter, QFont, QFontDatabase
 from PyQt6.QtCore import Qt
 from PyQt6.QtSvg import QSvgRenderer
 
@@ -25,6 +25,9 @@ class ResourceManager:
         self._default_font_size = 9
         self._loaded_fonts: Dict[str, int] = {}  # font_name -> font_id
 
+        # Icon cache
+        self._toolbar_icons: Dict[str, Optional[QIcon]] = {}  # action_name -> icon (None if missing)
+
     def _get_base_path(self) -> Path:
         """Get the base path of the application."""
         if getattr(sys, 'frozen', False):
@@ -81,10 +84,34 @@ class ResourceManager:
 
         return QIcon()  # Empty icon if neither found
 
-    def get_toolbar_icon(self, action_name: str) -> QIcon:
-        """Get toolbar icon by action name."""
-        icon_name = f"{action_name}.svg"
-        return self.load_icon(icon_name, "toolbar")
+    def get_toolbar_icon(self, action_name: str) -> Optional[QIcon]:
+        """Get toolbar icon by action name (rendered once, then cached). None if missing."""
+        if action_name not in self._toolbar_icons:
+            icon_path = self.get_icon_path(f"{action_name}.svg", "toolbar")
+            if icon_path:
+                icon = self._render_svg_icon(icon_path, (16, 32))
+            else:
+                print(f"Warning: Icon not found: {action_name}.svg")
+                icon = None
+            self._toolbar_icons[action_name] = icon
+        return self._toolbar_icons[action_name]
+
+    def _render_svg_icon(self, icon_path: Path, sizes) -> Optional[QIcon]:
+        """Rasterise an SVG file into a QIcon holding one pixmap per size."""
+        renderer = QSvgRenderer(str(icon_path))
+        if not renderer.isValid():
+            print(f"Warning: Invalid SVG icon: {icon_path.name}")
+            return None
+
+        icon = QIcon()
+        for size in sizes:
+            pixmap = QPixmap(size, size)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            renderer.render(painter)
+            painter.end()
+            icon.addPixmap(pixmap)
+        return icon
 
     # ========== FONT MANAGEMENT ==========
 
@@ -9,13 +9,26 @@ Follows the same professional styling as CommandFormatter and OutputLogFormatter
 
 import threading
 from PyQt6.QtGui import QTextCharFormat, QColor, QFont, QTextCursor
-from PyQt6.QtWidgets import QTextEdit
+from PyQt6.QtWidgets import QPlainTextEdit
 from datetime import datetime
 import re
 from constants import TerminalColors
 from ui.resources import resource_manager
 
 
+# Characters QTextDocument.toPlainText() renders as '\n'
+_LINE_BREAKS = ('\u2029', '\u2028', '\n')
+
+# Line prefixes for non-incoming data types
+_PREFIX_MAP = {
+    'outgoing': 'Send',
+    'status': 'Info',
+    'error': 'Error',
+    'warning': 'Warning',
+    'help': 'Help'
+}
+
+
 class TerminalStreamFormatter:
     """
     Formats terminal stream data with color-coded data flow and consistent styling.
@@ -102,6 +115,7 @@ class TerminalStreamFormatter:
         
         # Create all text formats upfront
         self.formats = {}
+        self._format_cache = {}  # (format_name, bold) -> derived QTextCharFormat
         self._create_formats()
         
         # Simple NMEA detection pattern
@@ -135,12 +149,23 @@ class TerminalStreamFormatter:
             self.formats[f'nmea_{nmea_type}'] = fmt
     
     def _get_format(self, format_name: str, bold: bool = False) -> QTextCharFormat:
-        """Get a format by name, optionally with bold."""
-        fmt = QTextCharFormat(self.formats.get(format_name, self.formats['default']))
-        if bold:
-            fmt.setFontWeight(QFont.Weight.Bold)
+        """Get a format by name, optionally with bold (built once, then cached)."""
+        key = (format_name, bold)
+        fmt = self._format_cache.get(key)
+        if fmt is None:
+            fmt = QTextCharFormat(self.formats.get(format_name, self.formats['default']))
+            if bold:
+                fmt.setFontWeight(QFont.Weight.Bold)
+            self._format_cache[key] = fmt
         return fmt
     
+    @staticmethod
+    def _needs_line_break(text_edit: QPlainTextEdit) -> bool:
+        """Check whether the document ends mid-line, without copying it to a string."""
+        doc = text_edit.document()
+        last = doc.characterCount() - 2  # The final character is the implicit block end
+        return last >= 0 and doc.characterAt(last) not in _LINE_BREAKS
+    
     def _detect_nmea_message_type(self, data: str) -> str:
         """
         Simple NMEA message type detection.
@@ -192,13 +217,13 @@ class TerminalStreamFormatter:
                 
         return None
     
-    def append_data(self, text_edit: QTextEdit, data: str, data_type: str = "incoming", 
+    def append_data(self, text_edit: QPlainTextEdit, data: str, data_type: str = "incoming", 
                    show_timestamp: bool = True, detected_type: str = None):
         """
         Format and append serial data to the text edit widget.
         
         Args:
-            text_edit: The QTextEdit widget to append to
+            text_edit: The QPlainTextEdit widget to append to
             data: The data to format and display
             data_type: The data type (incoming, outgoing, status, error)
             show_timestamp: Whether to show timestamp prefix
@@ -215,7 +240,7 @@ class TerminalStreamFormatter:
             text_edit.setTextCursor(cursor)
         
         # Add newline if needed
-        if text_edit.toPlainText() and not text_edit.toPlainText().endswith('\n'):
+        if self._needs_line_break(text_edit):
             cursor.insertText('\n')
         
         # Add timestamp if requested
@@ -225,14 +250,7 @@ class TerminalStreamFormatter:
         
         # Add data type prefix for non-incoming data
         if data_type != "incoming":
-            prefix_map = {
-                'outgoing': 'Send',
-                'status': 'Info',
-                'error': 'Error',
-                'warning': 'Warning',
-                'help': 'Help'
-            }
-            prefix = prefix_map.get(data_type, data_type.upper())
+            prefix = _PREFIX_MAP.get(data_type, data_type.upper())
             cursor.insertText(f"[{prefix}] ", self._get_format(data_type, bold=True))
         
         # Detect NMEA message type if not provided
@@ -252,7 +270,65 @@ class TerminalStreamFormatter:
         # Auto-scroll if enabled
         self._auto_scroll_if_enabled(text_edit)
     
-    def append_separator(self, text_edit: QTextEdit, label: str = ""):
+    def append_lines(self, text_edit: QPlainTextEdit, lines, data_type: str = "incoming",
+                     show_timestamp: bool = True):
+        """
+        Append several lines of serial data as one edit block.
+        
+        Args:
+            text_edit: The QPlainTextEdit widget to append to
+            lines: The lines to display (empty lines are skipped)
+            data_type: The data type (incoming, outgoing, status, error)
+            show_timestamp: Whether to show timestamp prefix (one timestamp per batch)
+        """
+        if not text_edit:
+            return
+        
+        cursor = text_edit.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        
+        # Only update the cursor position if auto-scroll is enabled
+        if self.is_auto_scroll_enabled():
+            text_edit.setTextCursor(cursor)
+        
+        timestamp = None
+        if show_timestamp:
+            timestamp = f"[{datetime.now().strftime('%H:%M:%S.%f')[:-3]}] "
+        timestamp_format = self.formats['timestamp']
+        default_format = self.formats.get(data_type, self.formats['default'])
+        prefix = None
+        if data_type != "incoming":
+            prefix = f"[{_PREFIX_MAP.get(data_type, data_type.upper())}] "
+        
+        cursor.beginEditBlock()
+        try:
+            # Add newline if needed
+            if self._needs_line_break(text_edit):
+                cursor.insertText('\n')
+            
+            for line in lines:
+                if not line:
+                    continue
+                if timestamp:
+                    cursor.insertText(timestamp, timestamp_format)
+                if prefix:
+                    cursor.insertText(prefix, self._get_format(data_type, bold=True))
+                
+                # Choose format based on NMEA type or default data type
+                detected_type = self._detect_nmea_message_type(line) if data_type == "incoming" else None
+                if detected_type and detected_type in self.nmea_colors:
+                    data_format = self.formats.get(f'nmea_{detected_type}', self.formats['default'])
+                else:
+                    data_format = default_format
+                cursor.insertText(line, data_format)
+                cursor.insertText('\n')
+        finally:
+            cursor.endEditBlock()
+        
+        # Auto-scroll if enabled
+        self._auto_scroll_if_enabled(text_edit)
+    
+    def append_separator(self, text_edit: QPlainTextEdit, label: str = ""):
         """Add a visual separator line to the terminal stream."""
         if not text_edit:
             return
@@ -262,7 +338,7 @@ class TerminalStreamFormatter:
         text_edit.setTextCursor(cursor)
         
         # Add spacing
-        if text_edit.toPlainText() and not text_edit.toPlainText().endswith('\n'):
+        if self._needs_line_break(text_edit):
             cursor.insertText('\n')
         cursor.insertText('\n')
         
@@ -280,30 +356,30 @@ class TerminalStreamFormatter:
         # Auto-scroll if enabled
         self._auto_scroll_if_enabled(text_edit)
     
-    def append_status(self, text_edit: QTextEdit, message: str, status_type: str = "status"):
+    def append_status(self, text_edit: QPlainTextEdit, message: str, status_type: str = "status"):
         """Add a status message to the terminal stream."""
         self.append_data(text_edit, message, status_type, show_timestamp=True)
     
-    def clear(self, text_edit: QTextEdit):
+    def clear(self, text_edit: QPlainTextEdit):
         """Clear all content from the text edit."""
         if text_edit:
             text_edit.clear()
     
-    def format_connection_start(self, text_edit: QTextEdit, port_name: str, baud_rate: int):
+    def format_connection_start(self, text_edit: QPlainTextEdit, port_name: str, baud_rate: int):
         """Format the connection start message."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.append_separator(text_edit, f"Connection established - {timestamp}")
         self.append_status(text_edit, f"Serial port {port_name} ready ({baud_rate} bps)", "status")
         self.append_separator(text_edit)
     
-    def format_connection_end(self, text_edit: QTextEdit, port_name: str):
+    def format_connection_end(self, text_edit: QPlainTextEdit, port_name: str):
         """Format the connection end message."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.append_separator(text_edit, f"Connection closed - {timestamp}")
         self.append_status(text_edit, f"Serial port {port_name} disconnected", "status")
         self.append_separator(text_edit)
     
-    def _auto_scroll_if_enabled(self, text_edit: QTextEdit):
+    def _auto_scroll_if_enabled(self, text_edit: QPlainTextEdit):
         """Auto-scroll to bottom if auto-scroll is enabled."""
         if not text_edit:
             return
@@ -334,7 +410,7 @@ class TerminalStreamFormatter:
         with self._scroll_lock:
             return self.auto_scroll_enabled
     
-    def force_scroll_to_bottom(self, text_edit: QTextEdit):
+    def force_scroll_to_bottom(self, text_edit: QPlainTextEdit):
         """Force scroll to bottom regardless of auto-scroll setting."""
         if text_edit:
             scrollbar = text_edit.verticalScrollBar()